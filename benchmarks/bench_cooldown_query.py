@@ -0,0 +1,140 @@
+"""
+Benchmark of cooldown rule evaluation on large command_usage table.
+
+Compares previous implementation (one COUNT(*) per rule, ISO-8601 text timestamps)
+with current one (integer epoch ms timestamps, one aggregate query for all windows).
+
+Usage (from repository root):
+    python -m benchmarks.bench_cooldown_query --rows 2000000 --iterations 2000
+"""
+import argparse
+import asyncio
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from modules.engine.cooldown_manager import CooldownManager
+from modules.engine.database import Database
+from modules.engine.migrations import MIGRATIONS
+
+GUILDS = 50
+USERS = 5000
+FEATURES = ["sra_command", "honk_response", "swearer_command"]
+SPAN_DAYS = 30
+RULES = [("15 minute limit", 9999, 900), ("1 hour limit", 9999, 3600), ("1 day limit", 9999, 86400)]
+
+HOT_USER, HOT_GUILD, HOT_FEATURE = 1, 1, "sra_command"
+
+
+def build_database(path: str, rows: int, legacy: bool):
+    conn = sqlite3.connect(path)
+    for version, _, statements in MIGRATIONS:
+        if legacy and version > 3: # schema before integer timestamps
+            break
+        for statement in statements:
+            conn.execute(statement)
+    conn.commit()
+
+    rng = random.Random(42)
+    now = time.time()
+    span = SPAN_DAYS * 86400
+
+    def generate():
+        for i in range(rows):
+            # every 200th row belongs to the "hot" user, so his windows are not empty
+            if i % 200 == 0:
+                user_id, guild_id, feature = HOT_USER, HOT_GUILD, HOT_FEATURE
+            else:
+                user_id, guild_id, feature = rng.randint(1, USERS), rng.randint(1, GUILDS), rng.choice(FEATURES)
+            ts = now - rng.random() * span
+            if legacy:
+                value = datetime.fromtimestamp(ts, timezone.utc).isoformat()
+            else:
+                value = int(ts * 1000)
+            yield user_id, guild_id, feature, value
+
+    conn.execute("BEGIN")
+    conn.executemany("INSERT INTO command_usage (user_id, guild_id, feature_name, timestamp) VALUES (?, ?, ?, ?)", generate())
+    conn.executemany(
+        "INSERT INTO guild_cooldowns (guild_id, feature_name, limit_name, limit_count, period_seconds) VALUES (?, ?, ?, ?, ?)",
+        [(HOT_GUILD, HOT_FEATURE, name, limit, period) for name, limit, period in RULES]
+    )
+    conn.commit()
+    conn.execute("ANALYZE")
+    conn.close()
+
+
+async def legacy_check(db: Database, user_id: int, guild_id: int, feature_name: str):
+    # Copy of previous CooldownManager.check_cooldown: rules query + COUNT(*) per rule on ISO strings
+    rules = await db.fetchall(
+        "SELECT limit_name, limit_count, period_seconds FROM guild_cooldowns WHERE guild_id = ? AND feature_name = ?",
+        (guild_id, feature_name)
+    )
+    now = datetime.now(timezone.utc)
+    for rule in rules:
+        start_time = now - timedelta(seconds=rule['period_seconds'])
+        result = await db.fetchone(
+            "SELECT COUNT(*) FROM command_usage WHERE user_id = ? AND guild_id = ? AND feature_name = ? AND timestamp >= ?",
+            (user_id, guild_id, feature_name, start_time.isoformat())
+        )
+        if result[0] >= rule['limit_count']:
+            return False
+    return True
+
+
+async def measure(check, iterations: int) -> list[float]:
+    for _ in range(50): # warm up page cache and statement cache
+        await check(HOT_USER, HOT_GUILD, HOT_FEATURE)
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await check(HOT_USER, HOT_GUILD, HOT_FEATURE)
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    return timings
+
+
+def report(name: str, timings: list[float]):
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"{name:<28} mean {statistics.mean(timings):9.1f} us | p50 {statistics.median(timings):9.1f} us | p95 {p95:9.1f} us")
+    return statistics.mean(timings)
+
+
+async def run(rows: int, iterations: int, mode: str):
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = os.path.join(tmp, "legacy.db")
+        current_path = os.path.join(tmp, "current.db")
+
+        print(f"Building databases with {rows} command_usage rows...")
+        build_database(legacy_path, rows, legacy=True)
+        build_database(current_path, rows, legacy=False)
+
+        legacy_db = Database(legacy_path, mode=mode)
+        current_db = Database(current_path, mode=mode)
+        await legacy_db.connect()
+        await current_db.connect()
+        try:
+            manager = CooldownManager(current_db)
+            legacy_mean = report("per-rule COUNT, ISO text", await measure(lambda *a: legacy_check(legacy_db, *a), iterations))
+            current_mean = report("single aggregate, epoch ms", await measure(manager.check_cooldown, iterations))
+            print(f"Speedup: {legacy_mean / current_mean:.2f}x")
+        finally:
+            await legacy_db.close()
+            await current_db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--mode", choices=["single", "wal"], default="wal")
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.iterations, args.mode))
+
+
+if __name__ == "__main__":
+    main()
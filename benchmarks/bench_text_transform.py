@@ -0,0 +1,127 @@
+"""
+Microbenchmark of sra / swearer text transforms on ~2k character inputs.
+
+Compares previous implementations (repeated lower()/count() per candidate, words.index,
+list.insert per swear) with shared single-pass engine from modules/fun/text_transform.py.
+Also compares random.sample with sample_distinct on a large swear pack (tuple, as cached per guild).
+
+Usage (from repository root):
+    python -m benchmarks.bench_text_transform --chars 2000 --iterations 2000
+"""
+import argparse
+import random
+import statistics
+import string
+import time
+
+from modules.fun.text_transform import sample_distinct, sra_transform, swear_transform
+
+SWEARS = [f"swear{i}" for i in range(500)]
+PUNCHLINES = [f"punchline {i}" for i in range(50)]
+
+
+# --- previous implementations, kept here only for comparison ---
+def legacy_sra(text: str, rng: random.Random):
+    if not text or not text.strip():
+        return None, "sra:error_no_text_provided"
+    words = text.split()
+    potential_words = [word for word in words if 'a' in word.lower() and len(word) > 2 and not word.lower().endswith("sra")]
+    if not potential_words:
+        return None, "sra:error_no_words_found"
+    best_word = None
+    highest_score = -1
+    for word in potential_words:
+        score = 0
+        if len(word) > 4:
+            score += 2
+        score += 3 * word.lower().count('a')
+        if word.lower().count('a') == 1 and word.lower().endswith('a'):
+            score -= 4
+        if score > highest_score:
+            highest_score = score
+            best_word = word
+    if best_word is None:
+        best_word = rng.choice(potential_words)
+    word_index = words.index(best_word)
+    a_indices = [i for i, char in enumerate(best_word) if char.lower() == 'a']
+    weights = [len(a_indices) - i for i in range(len(a_indices))]
+    chosen_a_index = rng.choices(a_indices, weights=weights, k=1)[0]
+    suffix = best_word[chosen_a_index + 1:]
+    words[word_index] = ("Sra" if best_word[0].isupper() else "sra") + suffix
+    return " ".join(words), None
+
+
+def legacy_swear(text: str, rng: random.Random) -> str:
+    words = text.split()
+    num_words = len(words)
+    if num_words == 0:
+        return ""
+    max_curses = num_words // 2
+    min_curses = max(0, num_words // 5 - 1)
+    num_curses = min(rng.randint(min_curses, max_curses), len(SWEARS))
+    if num_curses > 0:
+        for curse in rng.sample(SWEARS, num_curses):
+            words.insert(rng.randint(0, len(words)), curse)
+    punchline = rng.choice(PUNCHLINES)
+    return (" ".join(words) + " " + punchline).strip()
+
+
+def build_text(rng: random.Random, chars: int) -> str:
+    words = []
+    length = 0
+    while length < chars:
+        word = "".join(rng.choice(string.ascii_letters) for _ in range(rng.randint(2, 9)))
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)[:chars]
+
+
+def measure(function, texts, iterations: int) -> list[float]:
+    rng = random.Random(7)
+    samples = []
+    for i in range(iterations):
+        text = texts[i % len(texts)]
+        start = time.perf_counter()
+        function(text, rng)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+def report(name: str, legacy: list[float], current: list[float]):
+    print(f"{name}:")
+    for label, samples in (("previous", legacy), ("current", current)):
+        print(f"  {label:>8}: mean {statistics.mean(samples):8.1f} us, median {statistics.median(samples):8.1f} us")
+    print(f"  speedup (mean): {statistics.mean(legacy) / statistics.mean(current):.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chars", type=int, default=2000)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--pack-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    texts = [build_text(random.Random(seed), args.chars) for seed in range(50)]
+
+    # Same seed gives the same result (single spaces in input, so spacing is equal too)
+    for text in texts:
+        assert legacy_sra(text, random.Random(1)) == sra_transform(text, random.Random(1))
+
+    report("sra", measure(legacy_sra, texts, args.iterations), measure(sra_transform, texts, args.iterations))
+    report(
+        "swearer",
+        measure(legacy_swear, texts, args.iterations),
+        measure(lambda text, rng: swear_transform(text, SWEARS, PUNCHLINES, rng), texts, args.iterations)
+    )
+
+    # random.sample copies population when k is large compared to its size, sample_distinct never does
+    pack = tuple(f"swear{i}" for i in range(args.pack_size))
+    report(
+        f"sampling ({args.pack_size} swears)",
+        measure(lambda text, rng: rng.sample(pack, min(len(text.split()) // 2, len(pack))), texts, args.iterations),
+        measure(lambda text, rng: sample_distinct(pack, min(len(text.split()) // 2, len(pack)), rng), texts, args.iterations)
+    )
+
+
+if __name__ == "__main__":
+    main()
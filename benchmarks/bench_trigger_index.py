@@ -0,0 +1,100 @@
+"""
+Benchmark of auto-responder trigger matching with many triggers in one guild.
+
+Compares naive scan (every trigger checked against message with `in`)
+with GuildTriggers (exact dictionary lookup + one Aho-Corasick pass for word/substring triggers).
+
+Usage (from repository root):
+    python -m benchmarks.bench_trigger_index --triggers 10000 --messages 2000
+"""
+import argparse
+import random
+import statistics
+import string
+import time
+
+from modules.engine.trigger_index import MATCH_EXACT, MATCH_SUBSTRING, MATCH_WORD, GuildTriggers, _is_word_char
+
+MODES = [MATCH_EXACT, MATCH_WORD, MATCH_SUBSTRING]
+
+
+def random_word(rng: random.Random) -> str:
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9)))
+
+
+def build_rows(rng: random.Random, count: int) -> tuple[tuple[str, str, str], ...]:
+    triggers = set()
+    while len(triggers) < count:
+        triggers.add(" ".join(random_word(rng) for _ in range(rng.randint(1, 2))))
+    return tuple((trigger, f"response to {trigger}", rng.choice(MODES)) for trigger in sorted(triggers))
+
+
+def build_messages(rng: random.Random, rows, count: int) -> list[str]:
+    messages = []
+    for i in range(count):
+        words = [random_word(rng) for _ in range(rng.randint(5, 30))]
+        if i % 4 == 0: # every 4th message contains some trigger
+            words.insert(rng.randrange(len(words) + 1), rng.choice(rows)[0])
+        messages.append(" ".join(words))
+    return messages
+
+
+def naive_match(rows, content_lower: str):
+    # Same semantics as GuildTriggers.match, one check per trigger
+    best = None
+    for trigger, response, mode in rows:
+        if mode == MATCH_EXACT:
+            if content_lower == trigger:
+                return trigger, response
+            continue
+        start = content_lower.find(trigger)
+        while start != -1:
+            end = start + len(trigger)
+            if mode == MATCH_SUBSTRING or (
+                (start == 0 or not _is_word_char(content_lower[start - 1]))
+                and (end == len(content_lower) or not _is_word_char(content_lower[end]))
+            ):
+                if best is None or len(trigger) > len(best[0]):
+                    best = (trigger, response)
+                break
+            start = content_lower.find(trigger, start + 1)
+    return best
+
+
+def time_per_message(function, messages) -> list[float]:
+    samples = []
+    for message in messages:
+        start = time.perf_counter()
+        function(message)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--triggers", type=int, default=10000)
+    parser.add_argument("--messages", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    rows = build_rows(rng, args.triggers)
+    messages = build_messages(rng, rows, args.messages)
+
+    start = time.perf_counter()
+    triggers = GuildTriggers(rows)
+    triggers.match("") # compiles automaton
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"Index build for {len(rows)} triggers: {build_ms:.1f} ms")
+
+    mismatches = sum(1 for message in messages if triggers.match(message) != naive_match(rows, message))
+    print(f"Result mismatches: {mismatches}")
+
+    naive = time_per_message(lambda message: naive_match(rows, message), messages)
+    indexed = time_per_message(triggers.match, messages)
+    for name, samples in (("naive scan", naive), ("trigger index", indexed)):
+        print(f"{name:>14}: mean {statistics.mean(samples):9.1f} us, median {statistics.median(samples):9.1f} us, max {max(samples):9.1f} us")
+    print(f"Speedup (mean): {statistics.mean(naive) / statistics.mean(indexed):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
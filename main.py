@@ -10,6 +10,20 @@ from discord.ext import commands
 from discord import app_commands
 
 from modules.engine.sqlite_database_init import initialize_database
+from modules.engine.database import Database
+from modules.engine.cooldown_manager import CooldownManager
+from modules.engine.heavy_hitters import OffenderTracker
+from modules.engine.write_behind import WriteBehindBuffer
+from modules.engine.guild_config_cache import GuildConfigCache
+from modules.engine.member_index import MemberGuildIndex
+from modules.engine.message_router import MessageRouter
+from modules.engine.fair_scheduler import FairScheduler
+from modules.engine.recent_messages import RecentMessageCache
+from modules.engine.message_stats import MessageStats
+from modules.engine.leaderboard import ActivityLeaderboard
+from modules.engine.swear_packs import SwearPackCache
+from modules.engine.selectable_roles import SelectableRoleCache
+from modules.engine.bulk_roles import BulkRoleExecutor
 from modules.engine.lang_utils import LangUtils
 
 import logging 
@@ -58,6 +72,37 @@ class DiscordBot(commands.Bot):
     def __init__(self, config: dict, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.config = config
+        self.db: Optional[Database] = None # Shared database service, set up in main()
+        self.write_behind: Optional[WriteBehindBuffer] = None # Batched background writes, set up in main()
+        self.guild_config: Optional[GuildConfigCache] = None # Cached per-guild configuration, set up in main()
+        self.cooldown_manager: Optional[CooldownManager] = None # Shared between modules, set up in main()
+        self.offenders: Optional[OffenderTracker] = None # Most denied users per guild/feature, set up in main()
+        self.member_index: Optional[MemberGuildIndex] = None # user -> mutual guilds, set up in main()
+        self.message_router: Optional[MessageRouter] = None # Single on_message dispatcher, set up in main()
+        self.scheduler: Optional[FairScheduler] = None # Per-guild fair event processing, set up in main()
+        self.recent_messages: Optional[RecentMessageCache] = None # Last messages per channel, set up in main()
+        self.message_stats: Optional[MessageStats] = None # Buffered user_stats counters, set up in main()
+        self.leaderboard: Optional[ActivityLeaderboard] = None # Top active users per guild, set up in main()
+        self.swear_packs: Optional[SwearPackCache] = None # Per-guild swearer packs, set up in main()
+        self.selectable_roles: Optional[SelectableRoleCache] = None # Role panel map per guild, set up in main()
+        self.bulk_roles: Optional[BulkRoleExecutor] = None # Resumable bulk role jobs, set up in main()
+
+    async def close(self):
+        await super().close()
+        if self.scheduler is not None:
+            await self.scheduler.stop()
+        if self.cooldown_manager is not None:
+            await self.cooldown_manager.stop()
+        if self.guild_config is not None:
+            await self.guild_config.stop()
+        if self.message_stats is not None:
+            await self.message_stats.stop() # last counters flush before database is closed
+        if self.bulk_roles is not None:
+            await self.bulk_roles.stop() # running jobs save position and resume on next start
+        if self.write_behind is not None:
+            await self.write_behind.stop() # last flush before database is closed
+        if self.db is not None:
+            await self.db.close()
 
 # ==============================================================================
 # MAIN START FUNCTION
@@ -125,6 +170,114 @@ async def main():
      # Database initialization
     await initialize_database(DB_PATH)
     print("--- MAIN | OK | Database initialized succesfully.")
+
+    # One long-lived database connection for all modules
+    db_settings = config.get("database", {})
+    database = Database(
+        DB_PATH,
+        mode=db_settings.get("mode", "single"),
+        read_connections=db_settings.get("read_connections", 3),
+        cache_size_kib=db_settings.get("cache_size_kib", 16384),
+        mmap_size_mib=db_settings.get("mmap_size_mib", 128)
+    )
+    await database.connect()
+    bot.db = database
+    print("--- MAIN | OK | Shared database service started.")
+
+    write_behind = WriteBehindBuffer(
+        database,
+        flush_interval_ms=db_settings.get("write_behind_interval_ms", 500),
+        max_batch=db_settings.get("write_behind_max_batch", 500)
+    )
+    await write_behind.start()
+    bot.write_behind = write_behind
+
+    # Guild configuration is read from memory on hot paths
+    guild_config = GuildConfigCache(
+        database,
+        refresh_interval_seconds=db_settings.get("config_refresh_interval_seconds", 300)
+    )
+    await guild_config.start()
+    bot.guild_config = guild_config
+
+    # Cooldowns are shared by all modules, so memory backend sees every usage.
+    # Denials are counted in fixed-size sketches for moderators
+    offenders = OffenderTracker()
+    bot.offenders = offenders
+    cooldown_manager = CooldownManager(
+        database,
+        backend=config.get("bot_settings", {}).get("cooldown_backend", "sqlite"),
+        write_behind=write_behind,
+        guild_config=guild_config,
+        offenders=offenders
+    )
+    await cooldown_manager.start()
+    bot.cooldown_manager = cooldown_manager
+
+    # User -> mutual guilds index, kept current by member events
+    member_index = MemberGuildIndex(bot)
+    await bot.add_cog(member_index)
+    bot.member_index = member_index
+
+    # Event processing with per-guild queues, so one busy guild can't starve others
+    scheduler_settings = config.get("scheduler", {})
+    scheduler = FairScheduler(
+        workers=scheduler_settings.get("workers", 4),
+        max_queue_per_guild=scheduler_settings.get("max_queue_per_guild", 100),
+        low_priority_limit=scheduler_settings.get("low_priority_limit", 20)
+    )
+    await scheduler.start()
+    bot.scheduler = scheduler
+
+    # Every message is parsed once and dispatched to modules which registered a matcher
+    message_router = MessageRouter(bot, scheduler)
+    await bot.add_cog(message_router)
+    bot.message_router = message_router
+
+    # Recent messages per channel, so commands working on "last message" don't call channel history
+    recent_settings = config.get("recent_messages", {})
+    recent_messages = RecentMessageCache(
+        bot,
+        per_channel=recent_settings.get("per_channel", 10),
+        max_channels=recent_settings.get("max_channels", 1000),
+        idle_seconds=recent_settings.get("idle_minutes", 60) * 60
+    )
+    await bot.add_cog(recent_messages)
+    bot.recent_messages = recent_messages
+
+    # Message counting - in memory per message, batched UPSERT into user_stats, flushed totals update leaderboard
+    leaderboard = ActivityLeaderboard(database, size=config.get("bot_settings", {}).get("leaderboard_size", 10))
+    await leaderboard.load()
+    bot.leaderboard = leaderboard
+    message_stats = MessageStats(
+        bot,
+        database,
+        flush_interval_seconds=db_settings.get("stats_flush_interval_seconds", 30),
+        leaderboard=leaderboard
+    )
+    await bot.add_cog(message_stats)
+    await message_stats.start()
+    bot.message_stats = message_stats
+
+    # Swearer packs - default one from swears file, guild packs loaded from database on first use
+    swear_packs = SwearPackCache(database, ttl_seconds=db_settings.get("config_refresh_interval_seconds", 300))
+    swear_packs.load_default_file(os.path.join(config["data_dir"], config.get("data_files", {}).get("swears_file", "swears.json")))
+    bot.swear_packs = swear_packs
+
+    # Role panel - required role -> selectable roles per guild, invalidated by role panel admin commands
+    bot.selectable_roles = SelectableRoleCache(database)
+
+    # Bulk role jobs - paced member edits, progress in database, interrupted jobs resume after on_ready
+    bulk_settings = config.get("bulk_roles", {})
+    bulk_roles = BulkRoleExecutor(
+        bot,
+        database,
+        interval_seconds=bulk_settings.get("interval_seconds", 1.0),
+        checkpoint_every=bulk_settings.get("checkpoint_every", 25),
+        progress_interval_seconds=bulk_settings.get("progress_interval_seconds", 5)
+    )
+    await bot.add_cog(bulk_roles)
+    bot.bulk_roles = bulk_roles
     # Loading Cogs/Modules
 
     modules_to_load = load_module_list()
@@ -140,7 +293,8 @@ async def main():
     print("\n--- MAIN | OK | STARTUP SEQUENCE DONE ---")
     print("--- MAIN | Info | Trying to connect with Discord...")
     
-    await bot.start(TOKEN)
+    async with bot: # closes bot (and database) also on shutdown
+        await bot.start(TOKEN)
 
 
 # ==============================================================================
@@ -2,7 +2,6 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from discord.ui import Select, View
-import aiosqlite
 
 class ChannelSelectorDropdown(Select):
     def __init__(self, bot: commands.Bot, channels: list[discord.TextChannel]):
@@ -15,23 +14,12 @@ class ChannelSelectorDropdown(Select):
         super().__init__(placeholder="Wybierz kanal dla powiadomień", options=options) #TODO language pack
 
     async def callback(self, interaction: discord.Interaction):
-        # Loading database path from central bot config
-        db_path = self.bot.config["database_path"]
         selected_channel_id = int(self.values[0])
         guild_id = interaction.guild.id
 
         try:
-            async with aiosqlite.connect(db_path) as db:
-                # Using "INSERT ... ON CONFLICT... UPDATE" - safest way, will create new entry or update existing one for such server
-                await db.execute
-                (
-                """
-                INSERT INTO guild_settings (guild_id, notification_channel_id) VALUES (?,?)
-                ON CONFLICT(guild_id) DO UPDATE SET notification_channel_id = excluded.notification.channel.id 
-                """,
-                (guild_id, selected_channel_id)
-                )
-                await db.commit()
+            # Saved to database and cached setting at once
+            await self.bot.guild_config.set_notification_channel(guild_id, selected_channel_id)
             
             channel = self.bot.get_channel(selected_channel_id)
             await interaction.response.send_message(f"Kanał powiadomień został pomyślnie ustawiony na {channel.mention}!", ephemeral=True) #TODO language pack
@@ -0,0 +1,53 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+from typing import Optional
+
+class CooldownOffenders(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.offenders = self.bot.offenders # Fed by CooldownManager denials, created in main
+
+    @app_commands.command(name="cooldown_offenders", description="Shows users who hit cooldowns most often")
+    @app_commands.describe(
+        hours="Time window in hours",
+        feature="Feature to check (all features if empty)"
+    )
+    @app_commands.checks.has_permissions(moderate_members=True)
+    @app_commands.guild_only()
+    async def cooldown_offenders(self, interaction: discord.Interaction, hours: app_commands.Range[int, 1, 24] = 1, feature: Optional[str] = None):
+        window_seconds = min(hours * 3600, self.offenders.max_window_seconds)
+        top = self.offenders.top(interaction.guild.id, feature, window_seconds=window_seconds)
+        if not top:
+            await interaction.response.send_message(f"Nobody hit cooldowns in last {hours}h.", ephemeral=True)
+            return
+
+        lines = []
+        for position, (user_id, guaranteed, maximum) in enumerate(top, start=1):
+            # Sketch gives bounds - exact for frequent offenders, a range for rare ones
+            denials = str(guaranteed) if guaranteed == maximum else f"{guaranteed}-{maximum}"
+            lines.append(f"**{position}.** <@{user_id}> - {denials} denied uses")
+        embed = discord.Embed(
+            title=f"Cooldown offenders - last {hours}h" + (f" - {feature}" if feature else ""),
+            description="\n".join(lines),
+            color=discord.Color.orange()
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @cooldown_offenders.autocomplete("feature")
+    async def feature_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+        return [
+            app_commands.Choice(name=feature_name, value=feature_name)
+            for feature_name in self.offenders.features(interaction.guild.id)
+            if current.lower() in feature_name.lower()
+        ][:25]
+
+    @cooldown_offenders.error
+    async def cooldown_offenders_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        if isinstance(error, app_commands.MissingPermissions):
+            await interaction.response.send_message("You need 'Moderate members' permission to use this command.", ephemeral=True)
+        else:
+            raise error
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(CooldownOffenders(bot))
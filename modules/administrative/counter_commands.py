@@ -1,13 +1,12 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import aiosqlite
 import os
 
 class CounterCommands(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.db_path = self.bot.config["database_path"] 
+        self.guild_config = self.bot.guild_config # Cached guild configuration, shared from main
     counter_group = app_commands.Group(name="licznik", description="Zarządzanie licznikami rang")
 
     @counter_group.command(name="add_role_counter", description="Adds a channel for selecter role")
@@ -17,11 +16,9 @@ class CounterCommands(commands.Cog):
         guild = interaction.guild
         
         ### Checking if this role is not counted already ###
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute("SELECT 1 FROM role_counters WHERE guild_id = ? AND role_id =?", (guild.id, role.id)) as cursor:
-                if await cursor.fetchone():
-                    await interaction.response.send_message(f"Already counting role **{role.name}**!", ephemeral=True)
-                    return
+        if self.guild_config.get_counter_channel_id(guild.id, role.id) is not None:
+            await interaction.response.send_message(f"Already counting role **{role.name}**!", ephemeral=True)
+            return
         
         ### creating voice channel ###
         try:
@@ -30,19 +27,17 @@ class CounterCommands(commands.Cog):
                 guild.default_role: discord.PermissionOverwrite(connect=False),
                 guild.me: discord.PermissionOverwrite(connect=True) #bot has an access
             }
-            channel_name = f"{role.name}: {len(role.members)}"
+            # Tracked count from RoleCounter (counted once here, then kept by member events)
+            role_counter = self.bot.get_cog("RoleCounter")
+            count = role_counter.seed(role) if role_counter else len(role.members)
+            channel_name = f"{role.name}: {count}"
             channel = await guild.create_voice_channel(name=channel_name, overwrites=overwrites, reason=f"Counter for role {role.name}")
         except discord.errors.Forbidden:
             await interaction.response.send_message("Error, no privileges to set up channels", ephemeral=True)
             return
 
         ### Saving to database ###
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                "INSERT INTO role_counters (guild_id, role_id, channel_id) VALUES (?, ?, ?)",
-                (guild.id, role.id, channel.id)
-            )
-            await db.commit()
+        await self.guild_config.add_role_counter(guild.id, role.id, channel.id)
 
         await interaction.response.send_message(f"Succesfully created role counter for role **{role.name} n channel {channel.mention}.", ephemeral=True)
 
@@ -52,17 +47,16 @@ class CounterCommands(commands.Cog):
     async def remove_counter(self, interaction: discord.Interaction, role: discord.Role):
         guild = interaction.guild
 
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute("SELECT channel_id FROM role_counters WHERE guild_id = ? AND role_id = ?", (guild.id, role.id)) as cursor:
-                result = await cursor.fetchone()
-                if not result:
-                    await interaction.response.send_message(f"Not counting role **{role.name}**", ephemeral=True)
-                    return
-                channel_id = result[0]
+        channel_id = self.guild_config.get_counter_channel_id(guild.id, role.id)
+        if channel_id is None:
+            await interaction.response.send_message(f"Not counting role **{role.name}**", ephemeral=True)
+            return
 
-            ### removing from database ###
-            await db.execute("DELETE FROM role_counters WHERE guild_id = ? AND role_id = ?", (guild.id, role.id))
-            await db.commit
+        ### removing from database ###
+        await self.guild_config.remove_role_counter(guild.id, role.id)
+        role_counter = self.bot.get_cog("RoleCounter")
+        if role_counter:
+            role_counter.renamer.cancel(channel_id) # waiting rename would target removed (or kept) channel
 
         channel = guild.get_channel(channel_id)
         if channel:
@@ -42,5 +42,48 @@ class Owner(commands.Cog):
             await ctx.send(f"Succesfully synchronized {len(synced)} commands globally, changes might take an hour.")
             print(f"Synchronized {len(synced)} commands globally.")
 
+    @commands.command(name="dbstats")
+    @commands.is_owner()
+    async def prefix_dbstats(self, ctx: commands.Context):
+        """
+        !dbstats - shows write-behind buffer counters (queue depth, flush latency) and config cache hits
+        """
+        write_behind = getattr(self.bot, "write_behind", None)
+        if write_behind is None:
+            await ctx.send("Write-behind buffer is not running.")
+            return
+        lines = [f"{name}: {value}" for name, value in write_behind.stats().items()]
+        guild_config = getattr(self.bot, "guild_config", None)
+        if guild_config is not None:
+            lines += [f"config_cache_{name}: {value}" for name, value in guild_config.stats().items()]
+        message_stats = getattr(self.bot, "message_stats", None)
+        if message_stats is not None:
+            lines += [f"message_stats_{name}: {value}" for name, value in message_stats.stats().items()]
+        swear_packs = getattr(self.bot, "swear_packs", None)
+        if swear_packs is not None:
+            lines += [f"swear_packs_{name}: {value}" for name, value in swear_packs.stats().items()]
+        selectable_roles = getattr(self.bot, "selectable_roles", None)
+        if selectable_roles is not None:
+            lines += [f"selectable_roles_{name}: {value}" for name, value in selectable_roles.stats().items()]
+        await ctx.send("```\n" + "\n".join(lines) + "\n```")
+
+    @commands.command(name="schedstats")
+    @commands.is_owner()
+    async def prefix_schedstats(self, ctx: commands.Context, count: int = 10):
+        """
+        !schedstats [count] - shows event scheduler totals and busiest guilds (queue depth, drops)
+        """
+        scheduler = getattr(self.bot, "scheduler", None)
+        if scheduler is None:
+            await ctx.send("Event scheduler is not running.")
+            return
+        lines = [f"{name}: {value}" for name, value in scheduler.stats().items()]
+        lines.append("")
+        for guild_id, stats in scheduler.top_guilds(count):
+            guild = self.bot.get_guild(guild_id) if guild_id is not None else None
+            guild_name = guild.name if guild else ("DM" if guild_id is None else guild_id)
+            lines.append(f"{guild_name}: " + ", ".join(f"{name}={value}" for name, value in stats.items()))
+        await ctx.send("```\n" + "\n".join(lines) + "\n```")
+
 async def setup(bot: commands.Bot):
     await bot.add_cog(Owner(bot))
\ No newline at end of file
@@ -2,23 +2,25 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import aiosqlite
-from typing import List
+from typing import List, Optional
 
-class RolePanelAdmin(commands.cog):
+from ..engine.bulk_roles import BulkRoleJob, ACTION_ADD, ACTION_REMOVE, TARGET_ALL, TARGET_ROLE, TARGET_GROUP
+
+class RolePanelAdmin(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.db_path = self.bot.config["database_path"]
+        self.db = self.bot.db # Shared database service from main
+        self.selectable_roles = self.bot.selectable_roles # /role panel cache, edited guild is invalidated after every change
+        self.bulk_roles = self.bot.bulk_roles # Background bulk role jobs, shared from main
         
     # --- Helper function to autocomplete ---
     async def group_autocomplete(self,interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
     # Returns an list of group roles from server to be autocompleted
         choices = []
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute("SELECT group_name FROM role_groups WHERE guild_id = ?", (interaction.guild.id,))
-            groups = await cursor.fetchall()
-            for group in groups:
-                if current.lower() in group[0].lower():
-                    choices.append(app_commands.Choice(name=group[0], value=group[0]))
+        groups = await self.db.fetchall("SELECT group_name FROM role_groups WHERE guild_id = ?", (interaction.guild.id,))
+        for group in groups:
+            if current.lower() in group[0].lower():
+                choices.append(app_commands.Choice(name=group[0], value=group[0]))
         return choices[:25]
     
     # --- Command group ---
@@ -29,16 +31,14 @@ class RolePanelAdmin(commands.cog):
     #Create group
     @admin_role_group.command(name="create_group", description="Creates new role to be selected.") # TODO language pack
     @app_commands.describe(name="Group name (ex. Notifications)", description="Short group description") #TODO language pack
-    @app_commands.check.has_permissions(manage_roles=True)
+    @app_commands.checks.has_permissions(manage_roles=True)
     async def create_group(self, interaction: discord.Interaction, name:str, description:str):
         await interaction.response.defer(ephemeral=True)
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute(
-                    "INSERT INTO role_groups (guild_id, group_name, group_description) VALUES (?, ?, ?)",
-                    (interaction.guild.id, name, description)
-                )
-                await db.commit()
+            await self.db.execute(
+                "INSERT INTO role_groups (guild_id, group_name, group_description) VALUES (?, ?, ?)",
+                (interaction.guild.id, name, description)
+            )
             await interaction.followup.send(f"Succesfully created roles group: **{name}**.", ephemeral=True) #TODO language pack
         except aiosqlite.IntegrityError:
             await interaction.followup.send(f"Error: Group with name **{name}** already exists on this server.", ephemeral=True)
@@ -48,22 +48,30 @@ class RolePanelAdmin(commands.cog):
 
     #Delete group
     @admin_role_group.command(name="delete_group", description="Deletes role group.") # TODO language pack
-    @app_commands.describe(name="Group name to be deleted") #TODO language pack
+    @app_commands.describe(group="Group name to be deleted") #TODO language pack
     @app_commands.autocomplete(group=group_autocomplete)
     @app_commands.checks.has_permissions(manage_roles=True)
     async def delete_group(self, interaction: discord.Interaction, group:str):
         await interaction.response.defer(ephemeral=True)
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                cursor = await db.execute(
-                    "DELETE FROM role_groups WHERE guild_id = ? AND group_name = ?",
-                    (interaction.guild.id, group)
-                )
-                await db.commit()
-                if cursor.rowcount > 0:
-                    await interaction.followup.send(f"Succesfully role group **{group}**.", ephemeral=True)
-                else: 
-                    await interaction.followup.send(f"Error: Couldnt find group of name **{group}**.", ephemeral=True)
+            guild_id = interaction.guild.id
+
+            async def work(conn) -> int:
+                # Foreign keys are not enforced, so group's roles and permissions are removed here too
+                for table in ("selectable_roles", "role_group_permissions"):
+                    await conn.execute(
+                        f"DELETE FROM {table} WHERE group_id IN (SELECT group_id FROM role_groups WHERE guild_id = ? AND group_name = ?)",
+                        (guild_id, group)
+                    )
+                async with conn.execute("DELETE FROM role_groups WHERE guild_id = ? AND group_name = ?", (guild_id, group)) as cursor:
+                    return cursor.rowcount
+
+            rowcount = await self.db.transaction(work)
+            self.selectable_roles.invalidate(guild_id)
+            if rowcount > 0:
+                await interaction.followup.send(f"Succesfully deleted role group **{group}**.", ephemeral=True)
+            else: 
+                await interaction.followup.send(f"Error: Couldnt find group of name **{group}**.", ephemeral=True)
         except Exception as e:
             await interaction.followup.send(f"ERROR: Unexpected error ocurred: {e}", ephemeral=True)
 
@@ -76,23 +84,21 @@ class RolePanelAdmin(commands.cog):
     async def add_role_to_group(self, interaction: discord.Interaction, group: str, role: discord.Role, description: str):
         await interaction.response.defer(ephemeral=True)
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                # First check group_id on base of group name
-                cursor = await db.execute("SELECT group_id FROM role_groups WHERE guild_id = ? AND group_name = ?", (interaction.guild.id, group))
-                group_row = await cursor.fetchone()
-                if not group_row:
-                    await interaction.followup.send(f"ERROR: No found group with name **{group}**.", ephemeral=True)
-                    return
-                group_id = group_row[0]
-                
-                await db.execute(
-                    "INSERT INTO selectable_roles (guild_id, group_id, role_id, role_description) VALUES (?, ?, ?, ?)",
-                    (interaction.guild.id, group_id, role.id, description)
-                )
-                await db.commit
+            # First check group_id on base of group name
+            group_row = await self.db.fetchone("SELECT group_id FROM role_groups WHERE guild_id = ? AND group_name = ?", (interaction.guild.id, group))
+            if not group_row:
+                await interaction.followup.send(f"ERROR: No found group with name **{group}**.", ephemeral=True)
+                return
+            group_id = group_row[0]
+            
+            await self.db.execute(
+                "INSERT INTO selectable_roles (guild_id, group_id, role_id, role_description) VALUES (?, ?, ?, ?)",
+                (interaction.guild.id, group_id, role.id, description)
+            )
+            self.selectable_roles.invalidate(interaction.guild.id)
             await interaction.followup.send(f"Added role **{role.name}** to group **{group}**", ephemeral=True)
         except aiosqlite.IntegrityError:
-            await interaction.followup.send(f"Error: Role **{role.name} is already in group **{group}**", ephemeral=True)
+            await interaction.followup.send(f"Error: Role **{role.name}** is already in group **{group}**", ephemeral=True)
         except Exception as e:
             await interaction.followup.send(f"Unexpected error occured: {e}", ephemeral=True)
     
@@ -104,20 +110,19 @@ class RolePanelAdmin(commands.cog):
     async def remove_role_to_group(self, interaction: discord.Interaction, group: str, role: discord.Role):
         await interaction.response.defer(ephemeral=True)
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                cursor = await db.execute(
-                        """
-                        DELETE FROM selectable_roles
-                        WHERE role_id = ? AND group_id = (
-                            SELECT group_id FROM role_groups WHERE guild_id = ? AND group_name = ?
-                            )
-                        """, (role.id, interaction.guild.id, group)
-                )
-                await db.commit()
-                if cursor.rowcount > 0:
-                    await interaction.followup.send(f"Succesfully removed role **{role.name} from group **{group}**.", ephemeral=True)
-                else:
-                    await interaction.followup.send(f"ERROR: Not found such role in that group", ephemeral=True)
+            rowcount = await self.db.execute(
+                    """
+                    DELETE FROM selectable_roles
+                    WHERE role_id = ? AND group_id = (
+                        SELECT group_id FROM role_groups WHERE guild_id = ? AND group_name = ?
+                        )
+                    """, (role.id, interaction.guild.id, group)
+            )
+            self.selectable_roles.invalidate(interaction.guild.id)
+            if rowcount > 0:
+                await interaction.followup.send(f"Succesfully removed role **{role.name}** from group **{group}**.", ephemeral=True)
+            else:
+                await interaction.followup.send(f"ERROR: Not found such role in that group", ephemeral=True)
         except Exception as e:
             await interaction.followup.send(f"Occured unexpected error: {e}", ephemeral=True)
 
@@ -126,28 +131,122 @@ class RolePanelAdmin(commands.cog):
     @app_commands.describe(group="Group name", role_needed="Role, which gives permission to use this group")
     @app_commands.autocomplete(group=group_autocomplete)
     @app_commands.checks.has_permissions(manage_roles = True)
-    async def grant_access(self, interaction: discord.Interaction, group: str, role_needed= discord.Role):
+    async def grant_access(self, interaction: discord.Interaction, group: str, role_needed: discord.Role):
         await interaction.response.defer(ephemeral=True)
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                cursor = await db.execute("SELECT group_id FROM role_groups WHERE guild_id = ? AND group_name = ?",
-                                          (interaction.guild.id, group))
-                group_row = await cursor.fetchone()
-                if not group_row:
-                    await interaction.followup.send(f"ERROR:Couldn't find group with name **{group}**.", ephemeral=True)
-                    return
-                group_id = group_row[0]
-
-                await db.execute(
-                    "INSERT INTO role_group_permissions (guild_id, required_role_id, group_id) VALUES (?, ?, ?)",
-                    (interaction.guild.id, role_needed.id, group_id)
-                )
-                await db.commit()
-            await interaction.followup.send(f"Role **{role_needed} has now acces to this group: {group}.", ephemeral=True)
+            group_row = await self.db.fetchone("SELECT group_id FROM role_groups WHERE guild_id = ? AND group_name = ?",
+                                               (interaction.guild.id, group))
+            if not group_row:
+                await interaction.followup.send(f"ERROR:Couldn't find group with name **{group}**.", ephemeral=True)
+                return
+            group_id = group_row[0]
+
+            await self.db.execute(
+                "INSERT INTO role_group_permissions (guild_id, required_role_id, group_id) VALUES (?, ?, ?)",
+                (interaction.guild.id, role_needed.id, group_id)
+            )
+            self.selectable_roles.invalidate(interaction.guild.id)
+            await interaction.followup.send(f"Role **{role_needed.name}** has now acces to this group: {group}.", ephemeral=True)
         except aiosqlite.IntegrityError:
             await interaction.followup.send(f"ERROR: This role already has access to this group.", ephemeral=True)
         except Exception as e:
             await interaction.followup.send(f"ERROR: Unexpected error: {e}.", ephemeral=True)
 
+    # --- Bulk role assignment ---
+    @staticmethod
+    def _job_summary(job: BulkRoleJob) -> str:
+        action = "Giving" if job.action == ACTION_ADD else "Removing"
+        percent = job.processed * 100 // job.total if job.total else 100
+        text = f"{action} role <@&{job.role_id}> (job {job.job_id}): **{job.status}**, {job.processed}/{job.total} members ({percent}%)"
+        if job.failed:
+            text += f", {job.failed} failed"
+        if job.error:
+            text += f"\nReason: {job.error}"
+        return text
+
+    @admin_role_group.command(name="bulk_role", description="Gives or removes role for many members in background")
+    @app_commands.describe(
+        action="Give or remove role",
+        role="Role to give or remove",
+        target="Which members",
+        source_role="Members with this role (for target 'members with role')",
+        group="Members with any role of this group (for target 'members of group')"
+    )
+    @app_commands.choices(
+        action=[
+            app_commands.Choice(name="give", value=ACTION_ADD),
+            app_commands.Choice(name="remove", value=ACTION_REMOVE),
+        ],
+        target=[
+            app_commands.Choice(name="everyone", value=TARGET_ALL),
+            app_commands.Choice(name="members with role", value=TARGET_ROLE),
+            app_commands.Choice(name="members of group", value=TARGET_GROUP),
+        ]
+    )
+    @app_commands.autocomplete(group=group_autocomplete)
+    @app_commands.checks.has_permissions(manage_roles=True)
+    async def bulk_role(
+        self,
+        interaction: discord.Interaction,
+        action: app_commands.Choice[str],
+        role: discord.Role,
+        target: app_commands.Choice[str],
+        source_role: Optional[discord.Role] = None,
+        group: Optional[str] = None
+    ):
+        guild = interaction.guild
+        if role.is_default() or role.managed:
+            await interaction.response.send_message("ERROR: This role cannot be given or removed.", ephemeral=True)
+            return
+        if role >= guild.me.top_role:
+            await interaction.response.send_message(f"ERROR: Role **{role.name}** is above my highest role.", ephemeral=True)
+            return
+        if role >= interaction.user.top_role and interaction.user.id != guild.owner_id:
+            await interaction.response.send_message(f"ERROR: Role **{role.name}** is not below your highest role.", ephemeral=True)
+            return
+
+        target_id = None
+        if target.value == TARGET_ROLE:
+            if source_role is None:
+                await interaction.response.send_message("ERROR: Choose source_role for this target.", ephemeral=True)
+                return
+            target_id = source_role.id
+        elif target.value == TARGET_GROUP:
+            group_row = await self.db.fetchone("SELECT group_id FROM role_groups WHERE guild_id = ? AND group_name = ?", (guild.id, group)) if group else None
+            if not group_row:
+                await interaction.response.send_message(f"ERROR: No found group with name **{group}**.", ephemeral=True)
+                return
+            target_id = group_row[0]
+
+        await interaction.response.send_message("Starting bulk role job...", ephemeral=True)
+
+        async def progress(job: BulkRoleJob):
+            # Ephemeral message can be edited only through interaction (up to 15 minutes)
+            await interaction.edit_original_response(content=self._job_summary(job))
+
+        job = await self.bulk_roles.start_job(guild.id, role.id, action.value, target.value, target_id, interaction.user.id, progress=progress)
+        if job is None:
+            running = self.bulk_roles.active_job(guild.id)
+            await interaction.edit_original_response(content="ERROR: Another bulk role job is running on this server.\n" + self._job_summary(running))
+
+    @admin_role_group.command(name="bulk_status", description="Shows progress of current or last bulk role job")
+    @app_commands.checks.has_permissions(manage_roles=True)
+    async def bulk_status(self, interaction: discord.Interaction):
+        job = await self.bulk_roles.last_job(interaction.guild.id)
+        if job is None:
+            await interaction.response.send_message("There was no bulk role job on this server.", ephemeral=True)
+            return
+        await interaction.response.send_message(self._job_summary(job), ephemeral=True)
+
+    @admin_role_group.command(name="bulk_cancel", description="Stops running bulk role job")
+    @app_commands.checks.has_permissions(manage_roles=True)
+    async def bulk_cancel(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+        job = await self.bulk_roles.cancel(interaction.guild.id)
+        if job is None:
+            await interaction.followup.send("There is no running bulk role job on this server.", ephemeral=True)
+            return
+        await interaction.followup.send(self._job_summary(job), ephemeral=True)
+
 async def setup(bot: commands.Bot):
     await bot.add_cog(RolePanelAdmin(bot))
\ No newline at end of file
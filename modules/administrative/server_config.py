@@ -2,12 +2,13 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from discord.ui import View, Button, Select, Modal, TextInput
-import aiosqlite
+
+from ..engine.guild_config_cache import GuildConfigCache
 
 class WelcomeMessageModal(Modal, title="Edit welcome message"):
-    def __init__(self, db_path: str, current_message: str=""):
-        super().__init()
-        self.db_path = db_path
+    def __init__(self, guild_config: GuildConfigCache, current_message: str=""):
+        super().__init__()
+        self.guild_config = guild_config
         self.message_input = TextInput(
             label = "Welcome message",
             style=discord.TextStyle.paragraph,
@@ -21,12 +22,7 @@ class WelcomeMessageModal(Modal, title="Edit welcome message"):
     async def on_submit(self, interaction: discord.Interaction):
         new_message = self.message_input.value
         guild_id = interaction.guild.id
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                "UPDATE guild_settings SET welcome_message =? WHERE guild_id = ?",
-                (new_message, guild_id)
-            )
-            await db.commit()
+        await self.guild_config.set_welcome_message(guild_id, new_message)
         await interaction.response.send_message("Welcome message has been updated!", ephemeral=True)
 
 # --- Main view with buttons ---
@@ -35,7 +31,7 @@ class ConfigView(View):
         super().__init__(timeout=300)
         self.bot = bot
         self.author = author
-        self.db_path = self.bot.config["database_path"]
+        self.guild_config = self.bot.guild_config
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         if interaction.user.id != self.author.id:
@@ -46,13 +42,8 @@ class ConfigView(View):
     @discord.ui.button(label="Welcome message", style=discord.ButtonStyle.primary, emoji="👋")
     async def welcome_message_button(self, interaction: discord.Interaction, button: Button):
         # Download current message to show it in view
-        current_message = ""
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute("SELECT welcome_message FROM guild_settings WHERE guild_id = ?", (interaction.guild.id))
-            result = await cursor.fetchone()
-            if result and result[0]:
-                current_message = result[0]
-        modal = WelcomeMessageModal(self.db_path, current_message)
+        current_message = self.guild_config.get_welcome_message(interaction.guild.id) or ""
+        modal = WelcomeMessageModal(self.guild_config, current_message)
         await interaction.response.send_modal(modal)
 
 
@@ -0,0 +1,90 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from ..engine.swear_packs import KIND_SWEAR, KIND_PUNCHLINE
+
+KIND_CHOICES = [
+    app_commands.Choice(name="swear", value=KIND_SWEAR),
+    app_commands.Choice(name="punchline", value=KIND_PUNCHLINE),
+]
+MAX_ENTRY_LENGTH = 200
+
+
+class SwearPackCommands(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.swear_packs = self.bot.swear_packs # Per-guild swearer packs, shared from main
+    swear_pack_group = app_commands.Group(
+        name="swear_pack",
+        description="Server's own swears and punchlines for swearer",
+        guild_only=True,
+        default_permissions=discord.Permissions(manage_guild=True)
+    )
+
+    @swear_pack_group.command(name="add", description="Adds swear or punchline to this server's pack")
+    @app_commands.describe(kind="What to add", text="Swear or punchline text")
+    @app_commands.choices(kind=KIND_CHOICES)
+    @app_commands.checks.has_permissions(manage_guild=True)
+    async def add_entry(self, interaction: discord.Interaction, kind: app_commands.Choice[str], text: app_commands.Range[str, 1, MAX_ENTRY_LENGTH]):
+        text = text.strip()
+        if not text:
+            await interaction.response.send_message("Text cannot be empty.", ephemeral=True)
+            return
+        if await self.swear_packs.add_entry(interaction.guild.id, kind.value, text):
+            await interaction.response.send_message(f"Added {kind.name} **{text}**.", ephemeral=True)
+        else:
+            await interaction.response.send_message(f"This {kind.name} is already in server's pack.", ephemeral=True)
+
+    @swear_pack_group.command(name="remove", description="Removes swear or punchline from this server's pack")
+    @app_commands.describe(kind="What to remove", text="Swear or punchline text")
+    @app_commands.choices(kind=KIND_CHOICES)
+    @app_commands.checks.has_permissions(manage_guild=True)
+    async def remove_entry(self, interaction: discord.Interaction, kind: app_commands.Choice[str], text: str):
+        if await self.swear_packs.remove_entry(interaction.guild.id, kind.value, text.strip()):
+            await interaction.response.send_message(f"Removed {kind.name} **{text.strip()}**.", ephemeral=True)
+        else:
+            await interaction.response.send_message(f"There is no such {kind.name} in server's pack.", ephemeral=True)
+
+    @remove_entry.autocomplete("text")
+    async def text_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+        kind = getattr(interaction.namespace, "kind", None) or KIND_SWEAR
+        entries = await self.swear_packs.own_entries(interaction.guild.id, kind)
+        return [
+            app_commands.Choice(name=entry[:100], value=entry)
+            for entry in entries
+            if current.lower() in entry.lower() and len(entry) <= 100 # choice value is limited to 100 characters
+        ][:25]
+
+    @swear_pack_group.command(name="list", description="Shows this server's own swears and punchlines")
+    @app_commands.checks.has_permissions(manage_guild=True)
+    async def list_entries(self, interaction: discord.Interaction):
+        guild_id = interaction.guild.id
+        swears = await self.swear_packs.own_entries(guild_id, KIND_SWEAR)
+        punchlines = await self.swear_packs.own_entries(guild_id, KIND_PUNCHLINE)
+
+        def describe(entries: list[str]) -> str:
+            if not entries:
+                return "*default pack*"
+            text = ", ".join(entries)
+            return text if len(text) <= 1024 else text[:1020] + "..." # embed field limit
+
+        embed = discord.Embed(title=f"Swear pack - {interaction.guild.name}", color=discord.Color.red())
+        embed.add_field(name=f"Swears ({len(swears)})", value=describe(swears), inline=False)
+        embed.add_field(name=f"Punchlines ({len(punchlines)})", value=describe(punchlines), inline=False)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @swear_pack_group.command(name="reset", description="Removes server's own entries, default pack is used again")
+    @app_commands.checks.has_permissions(manage_guild=True)
+    async def reset_entries(self, interaction: discord.Interaction):
+        removed = await self.swear_packs.clear(interaction.guild.id)
+        await interaction.response.send_message(f"Removed {removed} entries, using default pack.", ephemeral=True)
+
+    async def cog_app_command_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        if isinstance(error, app_commands.MissingPermissions):
+            await interaction.response.send_message("You need 'Manage server' permission to use this command.", ephemeral=True)
+        else:
+            raise error
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(SwearPackCommands(bot))
@@ -0,0 +1,265 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional
+
+import discord
+from discord.ext import commands
+
+from .database import Database
+
+ACTION_ADD = "add"
+ACTION_REMOVE = "remove"
+
+TARGET_ALL = "all"
+TARGET_ROLE = "role"
+TARGET_GROUP = "group"
+
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_CANCELLED = "cancelled"
+STATUS_FAILED = "failed"
+
+JOB_COLUMNS = "job_id, guild_id, role_id, action, target_type, target_id, requested_by, status, last_user_id, total, processed, failed, error"
+
+
+def now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+class BulkRoleJob:
+    __slots__ = (
+        "job_id", "guild_id", "role_id", "action", "target_type", "target_id", "requested_by",
+        "status", "last_user_id", "total", "processed", "failed", "error", "task", "progress", "last_progress"
+    )
+
+    def __init__(self, job_id: int, guild_id: int, role_id: int, action: str, target_type: str, target_id: Optional[int], requested_by: int,
+                 status: str = STATUS_RUNNING, last_user_id: int = 0, total: int = 0, processed: int = 0, failed: int = 0, error: Optional[str] = None):
+        self.job_id = job_id
+        self.guild_id = guild_id
+        self.role_id = role_id
+        self.action = action
+        self.target_type = target_type
+        self.target_id = target_id
+        self.requested_by = requested_by
+        self.status = status
+        self.last_user_id = last_user_id # members are processed in user_id order, everything up to this one is done
+        self.total = total
+        self.processed = processed
+        self.failed = failed
+        self.error = error # why job failed, shown by status command
+        self.task: Optional[asyncio.Task] = None
+        self.progress: Optional[Callable[["BulkRoleJob"], Awaitable[None]]] = None # progress message updater, only for jobs started in this session
+        self.last_progress = 0.0
+
+
+class BulkRoleExecutor(commands.Cog):
+    """
+    Background jobs giving or removing one role for many members (available as bot.bulk_roles).
+    Members are edited one by one every interval_seconds (member role route is rate limited per guild),
+    in user_id order - progress is saved to role_bulk_jobs every checkpoint_every members, so running
+    jobs continue from last saved member after restart. At most one job per guild runs at once.
+    """
+    def __init__(self, bot: commands.Bot, db: Database, interval_seconds: float = 1.0, checkpoint_every: int = 25, progress_interval_seconds: float = 5.0):
+        self.bot = bot
+        self.db = db
+        self.interval_seconds = interval_seconds
+        self.checkpoint_every = checkpoint_every
+        self.progress_interval_seconds = progress_interval_seconds
+        self._jobs: dict[int, BulkRoleJob] = {} # guild_id -> running job
+        self._resumed = False
+
+    # --- JOBS ---
+    def active_job(self, guild_id: int) -> Optional[BulkRoleJob]:
+        return self._jobs.get(guild_id)
+
+    async def last_job(self, guild_id: int) -> Optional[BulkRoleJob]:
+        job = self._jobs.get(guild_id)
+        if job is not None:
+            return job
+        row = await self.db.fetchone(f"SELECT {JOB_COLUMNS} FROM role_bulk_jobs WHERE guild_id = ? ORDER BY job_id DESC LIMIT 1", (guild_id,))
+        return BulkRoleJob(*row) if row else None
+
+    async def start_job(
+        self,
+        guild_id: int,
+        role_id: int,
+        action: str,
+        target_type: str,
+        target_id: Optional[int],
+        requested_by: int,
+        progress: Optional[Callable[[BulkRoleJob], Awaitable[None]]] = None
+    ) -> Optional[BulkRoleJob]:
+        # None if guild already has running job
+        if guild_id in self._jobs:
+            return None
+
+        timestamp = now_ms()
+
+        async def work(conn) -> int:
+            async with conn.execute(
+                """
+                INSERT INTO role_bulk_jobs (guild_id, role_id, action, target_type, target_id, requested_by, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (guild_id, role_id, action, target_type, target_id, requested_by, timestamp, timestamp)
+            ) as cursor:
+                return cursor.lastrowid
+
+        job_id = await self.db.transaction(work)
+        job = BulkRoleJob(job_id, guild_id, role_id, action, target_type, target_id, requested_by)
+        job.progress = progress
+        self._launch(job)
+        return job
+
+    async def cancel(self, guild_id: int) -> Optional[BulkRoleJob]:
+        job = self._jobs.get(guild_id)
+        if job is None:
+            return None
+        job.task.cancel()
+        try:
+            await job.task
+        except asyncio.CancelledError:
+            pass
+        # Job may have finished (done/failed with reason) before cancel reached it - that result stays.
+        # Saved again anyway, cancel could interrupt saving of final status
+        if job.status == STATUS_RUNNING:
+            job.status = STATUS_CANCELLED
+        await self._save(job)
+        await self._report(job, force=True)
+        return job
+
+    def _launch(self, job: BulkRoleJob):
+        self._jobs[job.guild_id] = job
+        job.task = asyncio.create_task(self._run(job), name=f"BulkRoles-{job.job_id}")
+
+    # --- LIFECYCLE ---
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # Jobs interrupted by restart continue once member cache is there (on_ready fires again after reconnects)
+        if self._resumed:
+            return
+        self._resumed = True
+        rows = await self.db.fetchall(f"SELECT {JOB_COLUMNS} FROM role_bulk_jobs WHERE status = ? ORDER BY job_id", (STATUS_RUNNING,))
+        for row in rows:
+            job = BulkRoleJob(*row)
+            if job.guild_id in self._jobs:
+                job.status = STATUS_CANCELLED # older duplicate, should not happen
+                await self._save(job)
+                continue
+            self._launch(job)
+        if rows:
+            print(f"#bulk_roles.py | Info | Resumed {len(rows)} bulk role jobs")
+
+    async def stop(self):
+        # Running jobs keep 'running' status and saved position, so they resume on next start
+        jobs = list(self._jobs.values())
+        for job in jobs:
+            job.task.cancel()
+        for job in jobs:
+            try:
+                await job.task
+            except asyncio.CancelledError:
+                pass
+            await self._save(job)
+        self._jobs.clear()
+
+    # --- EXECUTION ---
+    async def _targets(self, job: BulkRoleJob, guild: discord.Guild, role: discord.Role) -> list[discord.Member]:
+        # Members after resume point which still need change, in user_id order
+        if job.target_type == TARGET_ROLE:
+            source = guild.get_role(job.target_id)
+            candidates = source.members if source else []
+        elif job.target_type == TARGET_GROUP:
+            rows = await self.db.fetchall("SELECT role_id FROM selectable_roles WHERE group_id = ?", (job.target_id,))
+            group_role_ids = {row[0] for row in rows}
+            candidates = [member for member in guild.members if any(member_role.id in group_role_ids for member_role in member.roles)]
+        else:
+            candidates = guild.members
+
+        adding = job.action == ACTION_ADD
+        return sorted(
+            (
+                member for member in candidates
+                if member.id > job.last_user_id and not member.bot and (member.get_role(role.id) is None) == adding
+            ),
+            key=lambda member: member.id
+        )
+
+    async def _run(self, job: BulkRoleJob):
+        try:
+            guild = self.bot.get_guild(job.guild_id)
+            role = guild.get_role(job.role_id) if guild else None
+            if role is None:
+                await self._finish(job, STATUS_FAILED, "Server or role no longer exists")
+                return
+
+            targets = await self._targets(job, guild, role)
+            job.total = job.processed + len(targets)
+            await self._save(job)
+            await self._report(job, force=True)
+
+            reason = f"Bulk role {job.action} (job {job.job_id}, requested by {job.requested_by})"
+            for member in targets:
+                # Checked again - member may have left or got changed while job was waiting
+                current = guild.get_member(member.id)
+                requested = False
+                if current is not None and (current.get_role(role.id) is None) == (job.action == ACTION_ADD):
+                    try:
+                        if job.action == ACTION_ADD:
+                            await current.add_roles(role, reason=reason)
+                        else:
+                            await current.remove_roles(role, reason=reason)
+                    except discord.Forbidden:
+                        # Role hierarchy or missing permission - the same for every next member
+                        await self._finish(job, STATUS_FAILED, "No privileges to manage this role")
+                        return
+                    except discord.HTTPException as e:
+                        job.failed += 1
+                        print(f"#bulk_roles.py | WARNING | Job {job.job_id}: could not edit member {member.id}: {e}")
+                    requested = True
+
+                job.processed += 1
+                job.last_user_id = member.id
+                if job.processed % self.checkpoint_every == 0:
+                    await self._save(job)
+                await self._report(job)
+                if requested:
+                    await asyncio.sleep(self.interval_seconds) # pacing only after real requests
+
+            await self._finish(job, STATUS_DONE)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"#bulk_roles.py | ERROR | Job {job.job_id} stopped: {e}")
+            await self._finish(job, STATUS_FAILED, str(e))
+        finally:
+            if self._jobs.get(job.guild_id) is job:
+                del self._jobs[job.guild_id]
+
+    async def _finish(self, job: BulkRoleJob, status: str, error: Optional[str] = None):
+        job.status = status
+        job.error = error
+        await self._save(job)
+        await self._report(job, force=True)
+        print(f"#bulk_roles.py | Info | Job {job.job_id} on server {job.guild_id} {status}: {job.processed}/{job.total} members, {job.failed} failed")
+
+    async def _save(self, job: BulkRoleJob):
+        try:
+            await self.db.execute(
+                "UPDATE role_bulk_jobs SET status = ?, last_user_id = ?, total = ?, processed = ?, failed = ?, error = ?, updated_at = ? WHERE job_id = ?",
+                (job.status, job.last_user_id, job.total, job.processed, job.failed, job.error, now_ms(), job.job_id)
+            )
+        except Exception as e:
+            print(f"#bulk_roles.py | ERROR | Could not save progress of job {job.job_id}: {e}")
+
+    async def _report(self, job: BulkRoleJob, force: bool = False):
+        if job.progress is None:
+            return
+        now = time.monotonic()
+        if not force and now - job.last_progress < self.progress_interval_seconds:
+            return
+        job.last_progress = now
+        try:
+            await job.progress(job)
+        except discord.HTTPException:
+            job.progress = None # interaction token expired (15 minutes) - progress is still available with status command
@@ -1,63 +1,277 @@
-import aiosqlite
-from datetime import datetime, timedelta, timezone
+import asyncio
+import time
+from typing import Optional
+
+from .database import Database
+from .guild_config_cache import GuildConfigCache
+from .heavy_hitters import OffenderTracker
+from .sliding_window import SlidingWindowStore
+from .write_behind import WriteBehindBuffer
+
+# Cooldown backends:
+# "sqlite" - every check counts rows in command_usage
+# "memory" - checks use in-memory sliding windows, command_usage is only an audit log
+BACKEND_SQLITE = "sqlite"
+BACKEND_MEMORY = "memory"
+
+DEFAULT_RETENTION_SECONDS = 86400 # Used by memory backend when no rules are configured
+
+RULES_SQL = "SELECT limit_name, limit_count, period_seconds FROM guild_cooldowns WHERE guild_id = ? AND feature_name = ? ORDER BY cooldown_id"
+INSERT_USAGE_SQL = "INSERT INTO command_usage (user_id, guild_id, feature_name, timestamp) VALUES (?, ?, ?, ?)"
+# we are using INSER... ON CONFLICT... UPDATE, to update counter
+UPSERT_WARNING_SQL = """
+    INSERT INTO cooldown_warnings (user_id, guild_id, feature_name, warning_level)
+    VALUES (?, ?, ?, 1)
+    ON CONFLICT(user_id, guild_id, feature_name)
+    DO UPDATE SET warning_level = warning_level +1
+"""
+DELETE_WARNINGS_SQL = "DELETE FROM cooldown_warnings WHERE user_id = ? AND guild_id = ? AND feature_name = ?"
+
+
+def now_ms() -> int:
+    # command_usage.timestamp is stored as integer epoch milliseconds (UTC)
+    return int(time.time() * 1000)
+
+
+def window_counts_query(rule_count: int) -> str:
+    """
+    Builds one aggregate query which counts usages in every rule window at once.
+    Parameters: one window start per rule, then guild_id, user_id, feature_name and oldest window start.
+    Index range scan covers only the longest window.
+    """
+    window_sums = ", ".join("COALESCE(SUM(timestamp >= ?), 0)" for _ in range(rule_count))
+    return (
+        f"SELECT {window_sums} FROM command_usage "
+        "WHERE guild_id = ? AND user_id = ? AND feature_name = ? AND timestamp >= ?"
+    )
+
 
 class CooldownManager:
-    def __init__(self, db_path: str):
-        self.db_path = db_path  # Assuming database path is set in config
-        print("#cooldown_manager.py | OK |  CooldownManager(Database-drive) succesfully initialized")
+    def __init__(
+        self,
+        db: Database,
+        backend: str = BACKEND_SQLITE,
+        write_behind: Optional[WriteBehindBuffer] = None,
+        guild_config: Optional[GuildConfigCache] = None,
+        offenders: Optional[OffenderTracker] = None,
+        maintenance_interval_seconds: int = 60
+    ):
+        if backend not in (BACKEND_SQLITE, BACKEND_MEMORY):
+            raise ValueError(f"Unknown cooldown backend: {backend}")
+        self.db = db  # Shared database service from bot.db
+        self.backend = backend
+        self.write_behind = write_behind # Memory backend writes audit rows through it, if given
+        self.guild_config = guild_config # Rules are read from cache instead of database, if given
+        self.offenders = offenders # Denied usages are counted there, if given
+        self.maintenance_interval_seconds = maintenance_interval_seconds
+
+        # Memory backend state
+        self._rules: dict[tuple[int, str], list[tuple[str, int, int]]] = {} # (guild_id, feature_name) -> [(limit_name, limit_count, period_seconds)]
+        self._windows = SlidingWindowStore(DEFAULT_RETENTION_SECONDS * 1000)
+        self._warnings: dict[tuple[int, int, str], int] = {} # (user_id, guild_id, feature_name) -> warning_level
+        self._maintenance_task: Optional[asyncio.Task] = None
+        self._background_tasks: set[asyncio.Task] = set()
+        print(f"#cooldown_manager.py | OK |  CooldownManager({backend} backend) succesfully initialized")
+
+    # --- MEMORY BACKEND LIFECYCLE ---
+    async def start(self):
+        # Loads rules and rebuilds sliding windows from recent command_usage rows (memory backend only)
+        if self.backend != BACKEND_MEMORY:
+            return
+        await self.reload_rules()
+
+        oldest_needed = now_ms() - self._windows.retention_ms
+        rows = await self.db.fetchall(
+            "SELECT user_id, guild_id, feature_name, timestamp FROM command_usage WHERE timestamp >= ? ORDER BY timestamp",
+            (oldest_needed,)
+        )
+        self._windows.clear()
+        for user_id, guild_id, feature_name, timestamp in rows:
+            self._windows.add((user_id, guild_id, feature_name), timestamp)
+        print(f"#cooldown_manager.py | OK | Rebuilt {len(self._windows)} usage windows from {len(rows)} recent command_usage rows")
+
+        warning_rows = await self.db.fetchall("SELECT user_id, guild_id, feature_name, warning_level FROM cooldown_warnings")
+        self._warnings = {(user_id, guild_id, feature_name): level for user_id, guild_id, feature_name, level in warning_rows}
+
+        self._maintenance_task = asyncio.create_task(self._maintenance_loop(), name="CooldownMaintenance")
+
+    async def stop(self):
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            self._maintenance_task = None
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
+    async def reload_rules(self):
+        if self.guild_config is not None:
+            # Cache refreshes rules by itself, only retention has to follow them
+            longest_period = self.guild_config.longest_cooldown_seconds() or DEFAULT_RETENTION_SECONDS
+            self._windows.retention_ms = longest_period * 1000
+            return
+
+        rows = await self.db.fetchall("SELECT guild_id, feature_name, limit_name, limit_count, period_seconds FROM guild_cooldowns ORDER BY cooldown_id")
+        rules: dict[tuple[int, str], list[tuple[str, int, int]]] = {}
+        for guild_id, feature_name, limit_name, limit_count, period_seconds in rows:
+            rules.setdefault((guild_id, feature_name), []).append((limit_name, limit_count, period_seconds))
+        self._rules = rules
+
+        longest_period = max((row["period_seconds"] for row in rows), default=DEFAULT_RETENTION_SECONDS)
+        self._windows.retention_ms = longest_period * 1000
+
+    async def _maintenance_loop(self):
+        # Picks up rules changed outside of bot (ex. WebApp) and evicts idle windows
+        while True:
+            await asyncio.sleep(self.maintenance_interval_seconds)
+            try:
+                await self.reload_rules()
+                evicted = self._windows.evict_idle(now_ms())
+                if evicted:
+                    print(f"#cooldown_manager.py | Info | Evicted {evicted} idle usage windows")
+            except Exception as e:
+                print(f"#cooldown_manager.py | ERROR | Cooldown maintenance failed: {e}")
+
+    def _cached_rules(self, guild_id: int, feature_name: str):
+        if self.guild_config is not None:
+            return self.guild_config.get_cooldown_rules(guild_id, feature_name)
+        return self._rules.get((guild_id, feature_name))
+
+    def _check_in_memory(self, user_id: int, guild_id: int, feature_name: str) -> tuple[bool, str]:
+        rules = self._cached_rules(guild_id, feature_name)
+        if not rules:
+            return True, "" #No rules = no limit
+
+        now = now_ms()
+        counts = self._windows.counts_since(
+            (user_id, guild_id, feature_name),
+            [now - period_seconds * 1000 for _, _, period_seconds in rules]
+        )
+        return self._evaluate(rules, counts)
+
+    def _record_in_memory(self, user_id: int, guild_id: int, feature_name: str, timestamp: int):
+        # Memory is source of truth, database row is written in background as audit log
+        self._windows.add((user_id, guild_id, feature_name), timestamp)
+        self._write_in_background(INSERT_USAGE_SQL, (user_id, guild_id, feature_name, timestamp))
+
+    def _clear_warnings_in_memory(self, user_id: int, guild_id: int, feature_name: str):
+        # Database is touched only if there was anything to reset
+        if self._warnings.pop((user_id, guild_id, feature_name), None) is not None:
+            self._write_in_background(DELETE_WARNINGS_SQL, (user_id, guild_id, feature_name))
+
+    def _write_in_background(self, sql: str, params: tuple):
+        if self.write_behind is not None:
+            self.write_behind.enqueue(sql, params)
+        else:
+            self._run_in_background(self._execute_logged(sql, params))
+
+    async def _execute_logged(self, sql: str, params: tuple):
+        try:
+            await self.db.execute(sql, params)
+        except Exception as e:
+            print(f"#cooldown_manager.py | ERROR | Background write to database failed: {e}")
+
+    def _run_in_background(self, coro):
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _note_decision(self, user_id: int, guild_id: int, feature_name: str, decision: tuple[bool, str]) -> tuple[bool, str]:
+        # Feeds denials into offender sketch, passes decision through
+        if not decision[0] and self.offenders is not None:
+            self.offenders.record(guild_id, feature_name, user_id)
+        return decision
+
+    @staticmethod
+    def _evaluate(rules, counts) -> tuple[bool, str]:
+        # rules: (limit_name, limit_count, period_seconds), counts: usages in window of every rule
+        for (limit_name, limit_count, _), usage_count in zip(rules, counts):
+            if usage_count >= limit_count:
+                rule_name = limit_name or "Unnamed limit"
+                return False, f"Limit exceeded {rule_name.lower()}"
+        return True, ""
+
+    # --- PUBLIC API ---
     async def check_cooldown(self, user_id: int, guild_id: int, feature_name: str) -> tuple[bool,str]:
         #Check if user is on cooldown by downloading rules from database, returns (can_use, reason)
+        if self.backend == BACKEND_MEMORY:
+            return self._note_decision(user_id, guild_id, feature_name, self._check_in_memory(user_id, guild_id, feature_name))
 
         rules = []
-        #1. Download all cooldown rules for this function on guild
+        #1. Download all cooldown rules for this function on guild (from cache if available)
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row #allows access to colums per name
-                cursor = await db.execute(
-                    "SELECT limit_name, limit_count, period_seconds FROM guild_cooldowns WHERE guild_id = ? AND feature_name = ?",
-                    (guild_id, feature_name)
-                )
-                rules = await cursor.fetchall()
+            if self.guild_config is not None:
+                rules = self.guild_config.get_cooldown_rules(guild_id, feature_name)
+            else:
+                rules = await self.db.fetchall(RULES_SQL, (guild_id, feature_name))
         except Exception as e:
             print(f"#cooldown_manager.py| ERROR | Cannot download rules for cooldown from database {e}")
             return True, "" #In case of database error allow usage
-        
+
         if not rules:
             return True, "" #No rules in database = no limit
-        
-        now = datetime.now(timezone.utc)
-
-        #2. Check all rules
-        async with aiosqlite.connect(self.db_path) as db:
-            for rule in rules:
-                limit = rule['limit_count']
-                period = timedelta(seconds=rule['period_seconds'])
-                rule_name = rule['limit_name'] or "Unnamed limit"
-
-                start_time = now - period
-                
-                cursor = await db.execute(
-                    "SELECT COUNT(*) FROM command_usage WHERE user_id = ? AND guild_id = ? AND feature_name = ? AND timestamp >= ?",
-                    (user_id, guild_id, feature_name, start_time.isoformat())
-                )
-                usage_count = (await cursor.fetchone())[0]
-
-                if usage_count >= limit:
-                    reason = f"Limit exceeded {rule_name.lower()}"
-                    return False, reason
-                
-        return True, ""
-    
+
+        now = now_ms()
+        window_starts = [now - period_seconds * 1000 for _, _, period_seconds in rules]
+
+        #2. Count usages for all rules with single query and check them
+        counts = await self.db.fetchone(
+            window_counts_query(len(rules)),
+            (*window_starts, guild_id, user_id, feature_name, min(window_starts))
+        )
+        return self._note_decision(user_id, guild_id, feature_name, self._evaluate(rules, counts))
+
+    async def try_acquire(self, user_id: int, guild_id: int, feature_name: str) -> tuple[bool, str]:
+        """
+        Checks all cooldown rules and, if usage is allowed, records it and resets warnings.
+        Everything happens atomically (one transaction or one synchronous step in memory),
+        so two messages arriving together can't both pass the check. Returns (can_use, reason).
+        """
+        if self.backend == BACKEND_MEMORY:
+            can_use, reason = self._check_in_memory(user_id, guild_id, feature_name)
+            if can_use:
+                self._record_in_memory(user_id, guild_id, feature_name, now_ms())
+                self._clear_warnings_in_memory(user_id, guild_id, feature_name)
+            return self._note_decision(user_id, guild_id, feature_name, (can_use, reason))
+
+        async def work(conn) -> tuple[bool, str]:
+            if self.guild_config is not None:
+                rules = self.guild_config.get_cooldown_rules(guild_id, feature_name)
+            else:
+                async with conn.execute(RULES_SQL, (guild_id, feature_name)) as cursor:
+                    rules = await cursor.fetchall()
+
+            now = now_ms()
+            if rules:
+                window_starts = [now - period_seconds * 1000 for _, _, period_seconds in rules]
+                async with conn.execute(
+                    window_counts_query(len(rules)),
+                    (*window_starts, guild_id, user_id, feature_name, min(window_starts))
+                ) as cursor:
+                    counts = await cursor.fetchone()
+                can_use, reason = self._evaluate(rules, counts)
+                if not can_use:
+                    return can_use, reason
+
+            await conn.execute(INSERT_USAGE_SQL, (user_id, guild_id, feature_name, now))
+            await conn.execute(DELETE_WARNINGS_SQL, (user_id, guild_id, feature_name))
+            return True, ""
+
+        try:
+            return self._note_decision(user_id, guild_id, feature_name, await self.db.transaction(work))
+        except Exception as e:
+            print(f"#cooldown_manager.py| ERROR | Cannot check and record usage in database {e}")
+            return True, "" #In case of database error allow usage
+
     async def record_usage(self, user_id: int, guild_id: int, feature_name: str):
         ## Saves using function in database
-        timestamp = datetime.now(timezone.utc).isoformat()
+        timestamp = now_ms()
+        if self.backend == BACKEND_MEMORY:
+            self._record_in_memory(user_id, guild_id, feature_name, timestamp)
+            return
+        await self._insert_usage(user_id, guild_id, feature_name, timestamp)
+
+    async def _insert_usage(self, user_id: int, guild_id: int, feature_name: str, timestamp: int):
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute(
-                    "INSERT INTO command_usage (user_id, guild_id, feature_name, timestamp) VALUES (?, ?, ?, ?)",
-                    (user_id, guild_id, feature_name, timestamp)
-                )
-                await db.commit()
+            await self.db.execute(INSERT_USAGE_SQL, (user_id, guild_id, feature_name, timestamp))
         except Exception as e:
             print(f"CRITICAL ERROR(CooldownManager): Cannot save usage of command to database: {e}")
 
@@ -66,33 +280,29 @@ class CooldownManager:
         Raises an warning for the user and returns new level of warning.
         Resets warnings after 24hours after last try(optional)
         """
+        if self.backend == BACKEND_MEMORY:
+            key = (user_id, guild_id, feature_name)
+            self._warnings[key] = self._warnings.get(key, 0) + 1
+            self._write_in_background(UPSERT_WARNING_SQL, key)
+            return self._warnings[key]
 
-        async with aiosqlite.connect(self.db_path) as db:
-           # we are using INSER... ON CONFLICT... UPDATE, to update counter
-            await db.execute("""
-                INSERT INTO cooldown_warnings (user_id, guild_id, feature_name, warning_level)
-                VALUES (?, ?, ?, 1)
-                ON CONFLICT(user_id, guild_id, feature_name)
-                DO UPDATE SET warning_level = warning_level +1
-                """,
-                (user_id, guild_id, feature_name)
-            )
+        async def work(conn) -> int:
+            await conn.execute(UPSERT_WARNING_SQL, (user_id, guild_id, feature_name))
 
             #download updated warning level
-            cursor = await db.execute(
+            cursor = await conn.execute(
                 "SELECT warning_level FROM cooldown_warnings WHERE user_id = ? AND guild_id = ? AND feature_name = ?",
                 (user_id, guild_id, feature_name)
             )
             result = await cursor.fetchone()
-            await db.commit()
-
+            await cursor.close()
             return result[0] if result else 0
-        
+
+        return await self.db.transaction(work)
+
     async def reset_warnings(self, user_id: int, guild_id: int, feature_name: str):
         # Resets warning for user for such function"
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                "DELETE FROM cooldown_warnings WHERE user_id = ? AND guild_id = ? AND feature_name = ?",
-                (user_id, guild_id, feature_name)
-            )
-            await db.commit()
\ No newline at end of file
+        if self.backend == BACKEND_MEMORY:
+            self._clear_warnings_in_memory(user_id, guild_id, feature_name)
+            return
+        await self.db.execute(DELETE_WARNINGS_SQL, (user_id, guild_id, feature_name))
@@ -0,0 +1,195 @@
+import asyncio
+import aiosqlite
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+# Database modes:
+# "single" - one shared connection for reads and writes (rollback journal)
+# "wal"    - WAL journaling, one writer task with ordered queue + pool of read-only connections
+MODE_SINGLE = "single"
+MODE_WAL = "wal"
+
+
+class Database:
+    """
+    Long-lived database service shared by the whole bot (available as bot.db).
+    Connections are opened once in main() and kept until shutdown, so cogs do not pay
+    for a new worker thread and SQLite handle on every query, and compiled statements
+    are reused from sqlite3 statement cache.
+    """
+    def __init__(
+        self,
+        db_path: str,
+        mode: str = MODE_SINGLE,
+        read_connections: int = 3,
+        cached_statements: int = 256,
+        cache_size_kib: int = 16384,
+        mmap_size_mib: int = 128,
+        busy_timeout_ms: int = 5000,
+    ):
+        if mode not in (MODE_SINGLE, MODE_WAL):
+            raise ValueError(f"Unknown database mode: {mode}")
+        self.db_path = db_path
+        self.mode = mode
+        self.read_connections = max(1, read_connections)
+        self.cached_statements = cached_statements
+        self.cache_size_kib = cache_size_kib
+        self.mmap_size_mib = mmap_size_mib
+        self.busy_timeout_ms = busy_timeout_ms
+
+        self._conn: Optional[aiosqlite.Connection] = None # single mode connection / WAL mode writer connection
+        self._write_lock = asyncio.Lock() # Reads, writes and transactions can't interleave on one connection (single mode)
+        self._closed = False # set on close(), new reads/writes raise instead of waiting for writer which is gone
+
+        # WAL mode only
+        self._readers: list[aiosqlite.Connection] = []
+        self._reader_pool: Optional[asyncio.Queue] = None
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+
+    async def connect(self):
+        if self._conn is not None:
+            return
+        self._closed = False
+        self._conn = await aiosqlite.connect(self.db_path, cached_statements=self.cached_statements)
+        self._conn.row_factory = aiosqlite.Row # allows access to colums per name
+
+        if self.mode == MODE_WAL:
+            await self._setup_wal()
+            print(f"#database.py | OK | Opened database in WAL mode (1 writer, {len(self._readers)} readers): {self.db_path}")
+        else:
+            print(f"#database.py | OK | Opened shared database connection: {self.db_path}")
+
+    async def close(self):
+        if self._conn is None:
+            return
+        self._closed = True # before sentinel, so nothing is queued behind it
+        if self._writer_task is not None:
+            await self._write_queue.put(None) # Sentinel - writer finishes queued jobs first
+            await self._writer_task
+            self._writer_task = None
+        for reader in self._readers:
+            await reader.close()
+        self._readers.clear()
+
+        try:
+            await self._conn.execute("PRAGMA optimize")
+        except Exception as e:
+            print(f"#database.py | WARNING | PRAGMA optimize failed on shutdown: {e}")
+        await self._conn.close() # Last connection closed = WAL checkpointed
+        self._conn = None
+        print("#database.py | OK | Database connection closed")
+
+    # --- WAL MODE SETUP ---
+    async def _apply_pragmas(self, conn: aiosqlite.Connection):
+        await conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        await conn.execute(f"PRAGMA cache_size = -{int(self.cache_size_kib)}") # negative value = size in KiB
+        await conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size_mib) * 1024 * 1024}")
+        await conn.execute("PRAGMA temp_store = MEMORY")
+
+    async def _setup_wal(self):
+        # Writer connection
+        async with self._conn.execute("PRAGMA journal_mode = WAL") as cursor:
+            journal_mode = (await cursor.fetchone())[0]
+        if str(journal_mode).lower() != MODE_WAL:
+            print(f"#database.py | WARNING | Could not enable WAL journaling, SQLite kept: {journal_mode}")
+        await self._conn.execute("PRAGMA synchronous = NORMAL") # Safe in WAL, fsync only on checkpoint
+        await self._apply_pragmas(self._conn)
+
+        # Read-only connections pool
+        reader_uri = Path(self.db_path).absolute().as_uri() + "?mode=ro"
+        self._reader_pool = asyncio.Queue()
+        for _ in range(self.read_connections):
+            reader = await aiosqlite.connect(reader_uri, uri=True, cached_statements=self.cached_statements)
+            reader.row_factory = aiosqlite.Row
+            await self._apply_pragmas(reader)
+            await reader.execute("PRAGMA query_only = ON")
+            self._readers.append(reader)
+            self._reader_pool.put_nowait(reader)
+
+        # Dedicated writer task, jobs are executed in order of arrival
+        self._write_queue = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self._writer_loop(), name="DatabaseWriter")
+
+    async def _writer_loop(self):
+        while True:
+            job = await self._write_queue.get()
+            if job is None:
+                break
+            work, future = job
+            try:
+                result = await work(self._conn)
+                await self._conn.commit()
+            except Exception as e:
+                # Writer must survive failed rollback too - otherwise every next write waits forever
+                try:
+                    await self._conn.rollback()
+                except Exception as rollback_error:
+                    print(f"#database.py | ERROR | Rollback failed: {rollback_error}")
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+    def _check_open(self):
+        if self._closed or self._conn is None:
+            raise RuntimeError("Database is closed")
+
+    # --- READS ---
+    async def _read(self, sql: str, params: Iterable[Any], fetch_all: bool):
+        self._check_open()
+        if self.mode != MODE_WAL:
+            # One shared connection - reading during someone's transaction would see its uncommitted rows
+            async with self._write_lock:
+                async with self._conn.execute(sql, params) as cursor:
+                    return await (cursor.fetchall() if fetch_all else cursor.fetchone())
+
+        reader = await self._reader_pool.get()
+        try:
+            async with reader.execute(sql, params) as cursor:
+                return await (cursor.fetchall() if fetch_all else cursor.fetchone())
+        finally:
+            self._reader_pool.put_nowait(reader)
+
+    async def fetchone(self, sql: str, params: Iterable[Any] = ()) -> Optional[aiosqlite.Row]:
+        return await self._read(sql, params, fetch_all=False)
+
+    async def fetchall(self, sql: str, params: Iterable[Any] = ()) -> list[aiosqlite.Row]:
+        return await self._read(sql, params, fetch_all=True)
+
+    # --- WRITES ---
+    async def execute(self, sql: str, params: Iterable[Any] = ()) -> int:
+        # Runs single write statement in its own transaction, returns number of changed rows
+        async def work(conn: aiosqlite.Connection) -> int:
+            async with conn.execute(sql, params) as cursor:
+                return cursor.rowcount
+        return await self.transaction(work)
+
+    async def executemany(self, sql: str, seq_of_params: Iterable[Iterable[Any]]) -> int:
+        async def work(conn: aiosqlite.Connection) -> int:
+            async with conn.executemany(sql, seq_of_params) as cursor:
+                return cursor.rowcount
+        return await self.transaction(work)
+
+    async def transaction(self, work: Callable[[aiosqlite.Connection], Awaitable[Any]]) -> Any:
+        """
+        Runs work(connection) as one transaction and returns its result.
+        Commits when work finishes, rolls back and re-raises if it fails.
+        In WAL mode work is queued to the single writer task.
+        Raises RuntimeError after close().
+        """
+        self._check_open()
+        if self.mode == MODE_WAL:
+            future = asyncio.get_running_loop().create_future()
+            await self._write_queue.put((work, future))
+            return await future
+
+        async with self._write_lock:
+            try:
+                result = await work(self._conn)
+                await self._conn.commit()
+            except Exception:
+                await self._conn.rollback()
+                raise
+        return result
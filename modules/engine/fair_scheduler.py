@@ -0,0 +1,152 @@
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, Hashable, Optional
+
+# Job priorities. Low priority work (fun responses) is shed first when guild is over budget
+PRIORITY_HIGH = 0
+PRIORITY_LOW = 1
+
+Job = Callable[[], Awaitable[None]] # factory - coroutine is created only when job really runs
+
+
+class GuildQueue:
+    __slots__ = ("high", "low", "processed", "dropped_high", "dropped_low", "max_depth", "busy_ms")
+
+    def __init__(self):
+        self.high: deque[Job] = deque()
+        self.low: deque[Job] = deque()
+        self.processed = 0
+        self.dropped_high = 0
+        self.dropped_low = 0
+        self.max_depth = 0
+        self.busy_ms = 0.0 # time spent running this guild's jobs
+
+    @property
+    def depth(self) -> int:
+        return len(self.high) + len(self.low)
+
+    def pop(self) -> Optional[Job]:
+        if self.high:
+            return self.high.popleft()
+        if self.low:
+            return self.low.popleft()
+        return None
+
+    def stats(self) -> dict:
+        return {
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "processed": self.processed,
+            "dropped_high": self.dropped_high,
+            "dropped_low": self.dropped_low,
+            "busy_ms": round(self.busy_ms, 1),
+        }
+
+
+class FairScheduler:
+    """
+    Event processing shared by listeners (available as bot.scheduler).
+    Every guild has its own bounded queue and guilds are served round-robin,
+    at most one job per guild at a time - spamming guild waits for its own turn
+    and can't take workers away from quiet guilds.
+    Low priority jobs are shed when guild has more than low_priority_limit jobs waiting,
+    any job is dropped when guild queue is full (max_queue_per_guild).
+    """
+    def __init__(self, workers: int = 4, max_queue_per_guild: int = 100, low_priority_limit: int = 20):
+        self.worker_count = workers
+        self.max_queue_per_guild = max_queue_per_guild
+        self.low_priority_limit = low_priority_limit
+
+        self._queues: dict[Hashable, GuildQueue] = {}
+        self._rotation: asyncio.Queue = asyncio.Queue() # guilds with waiting jobs, each at most once
+        self._scheduled: set[Hashable] = set() # guilds in rotation or with job running
+        self._workers: list[asyncio.Task] = []
+
+    # --- LIFECYCLE ---
+    async def start(self):
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._worker(), name=f"FairSchedulerWorker-{i}") for i in range(self.worker_count)
+            ]
+
+    async def stop(self):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    # --- SUBMITTING ---
+    def submit(self, guild_id: Hashable, job: Job, priority: int = PRIORITY_LOW) -> bool:
+        """
+        Queues job for guild (None for DMs). Returns False if job has been dropped.
+        """
+        queue = self._queues.get(guild_id)
+        if queue is None:
+            queue = self._queues[guild_id] = GuildQueue()
+
+        depth = queue.depth
+        if priority == PRIORITY_LOW:
+            if depth >= min(self.low_priority_limit, self.max_queue_per_guild):
+                queue.dropped_low += 1
+                return False
+            queue.low.append(job)
+        else:
+            if depth >= self.max_queue_per_guild:
+                if not queue.low: # queue full of important work, new one has to go
+                    queue.dropped_high += 1
+                    return False
+                queue.low.popleft() # making room by shedding oldest low priority job
+                queue.dropped_low += 1
+            queue.high.append(job)
+
+        queue.max_depth = max(queue.max_depth, queue.depth)
+        if guild_id not in self._scheduled:
+            self._scheduled.add(guild_id)
+            self._rotation.put_nowait(guild_id)
+        return True
+
+    # --- DISPATCH ---
+    async def _worker(self):
+        while True:
+            guild_id = await self._rotation.get()
+            queue = self._queues[guild_id]
+            job = queue.pop()
+            if job is not None:
+                start = time.perf_counter()
+                try:
+                    await job()
+                except Exception as e:
+                    print(f"#fair_scheduler.py | ERROR | Job for guild {guild_id} failed: {type(e).__name__}: {e}")
+                queue.processed += 1
+                queue.busy_ms += (time.perf_counter() - start) * 1000
+
+            if queue.depth:
+                self._rotation.put_nowait(guild_id) # back of the line, other guilds go first
+            else:
+                self._scheduled.discard(guild_id)
+
+    # --- METRICS ---
+    def guild_stats(self, guild_id: Hashable) -> Optional[dict]:
+        queue = self._queues.get(guild_id)
+        return queue.stats() if queue is not None else None
+
+    def top_guilds(self, count: int = 10) -> list[tuple[Hashable, dict]]:
+        # Busiest guilds first: by drops, then by current queue depth
+        ranked = sorted(
+            self._queues.items(),
+            key=lambda item: (item[1].dropped_high + item[1].dropped_low, item[1].depth, item[1].processed),
+            reverse=True
+        )
+        return [(guild_id, queue.stats()) for guild_id, queue in ranked[:count]]
+
+    def stats(self) -> dict:
+        queues = self._queues.values()
+        return {
+            "guilds": len(self._queues),
+            "waiting_guilds": len(self._scheduled),
+            "queued": sum(queue.depth for queue in queues),
+            "processed": sum(queue.processed for queue in queues),
+            "dropped_high": sum(queue.dropped_high for queue in queues),
+            "dropped_low": sum(queue.dropped_low for queue in queues),
+        }
@@ -0,0 +1,190 @@
+import asyncio
+from typing import Any, Hashable, Optional
+
+from .database import Database
+
+
+class GuildConfigCache:
+    """
+    In-memory copy of per-guild configuration: guild_modules, guild_settings,
+    guild_cooldowns and role_counters (available as bot.guild_config).
+    Filled with one bulk query per table on startup, so hot paths (every message,
+    every member event) never go to database for configuration.
+    Admin commands write through this cache (database first, then cache entry).
+    Periodic reload picks up changes made outside of bot (ex. WebApp).
+    """
+    def __init__(self, db: Database, refresh_interval_seconds: int = 300):
+        self.db = db
+        self.refresh_interval_seconds = refresh_interval_seconds
+
+        self._modules: dict[tuple[int, str], tuple[bool, bool]] = {} # (guild_id, module_name) -> (is_enabled, allow_in_dm)
+        self._settings: dict[int, tuple[Optional[int], Optional[str]]] = {} # guild_id -> (notification_channel_id, welcome_message)
+        self._cooldown_rules: dict[tuple[int, str], tuple[tuple[str, int, int], ...]] = {} # (guild_id, feature_name) -> ((limit_name, limit_count, period_seconds), ...)
+        self._dm_thresholds: dict[tuple[int, str], int] = {} # (guild_id, feature_name) -> dm_warning_threshold
+        self._role_counters: dict[tuple[int, int], int] = {} # (guild_id, role_id) -> channel_id
+        self._counted_roles: dict[int, frozenset[int]] = {} # guild_id -> counted role ids, for member event filtering
+        self._longest_cooldown_seconds = 0
+
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock() # held by load() and write-throughs, reload can't overwrite newer write with stale rows
+        self._loaded = False
+
+        # Counters
+        self.hits = 0
+        self.absent = 0 # key not configured - expected for most roles/features
+        self.misses = 0 # lookups before first load, answered with defaults
+
+    # --- LOADING ---
+    async def load(self):
+        async with self._lock:
+            await self._load()
+
+    async def _load(self):
+        module_rows = await self.db.fetchall("SELECT guild_id, module_name, is_enabled, allow_in_dm FROM guild_modules")
+        settings_rows = await self.db.fetchall("SELECT guild_id, notification_channel_id, welcome_message FROM guild_settings")
+        cooldown_rows = await self.db.fetchall(
+            "SELECT guild_id, feature_name, limit_name, limit_count, period_seconds, dm_warning_threshold FROM guild_cooldowns ORDER BY cooldown_id"
+        )
+        counter_rows = await self.db.fetchall("SELECT guild_id, role_id, channel_id FROM role_counters")
+
+        rules: dict[tuple[int, str], list[tuple[str, int, int]]] = {}
+        dm_thresholds: dict[tuple[int, str], int] = {}
+        for guild_id, feature_name, limit_name, limit_count, period_seconds, dm_threshold in cooldown_rows:
+            rules.setdefault((guild_id, feature_name), []).append((limit_name, limit_count, period_seconds))
+            if dm_threshold is not None:
+                dm_thresholds.setdefault((guild_id, feature_name), dm_threshold)
+
+        # Swapping whole dictionaries at once, readers never see half loaded state
+        self._modules = {(row[0], row[1]): (bool(row[2]), bool(row[3])) for row in module_rows}
+        self._settings = {row[0]: (row[1], row[2]) for row in settings_rows}
+        self._cooldown_rules = {key: tuple(value) for key, value in rules.items()}
+        self._dm_thresholds = dm_thresholds
+        self._role_counters = {(row[0], row[1]): row[2] for row in counter_rows}
+        self._counted_roles = self._group_counted_roles(self._role_counters)
+        self._longest_cooldown_seconds = max((row["period_seconds"] for row in cooldown_rows), default=0)
+        self._loaded = True
+
+    @staticmethod
+    def _group_counted_roles(role_counters: dict[tuple[int, int], int]) -> dict[int, frozenset[int]]:
+        grouped: dict[int, set[int]] = {}
+        for guild_id, role_id in role_counters:
+            grouped.setdefault(guild_id, set()).add(role_id)
+        return {guild_id: frozenset(role_ids) for guild_id, role_ids in grouped.items()}
+
+    async def start(self):
+        await self.load()
+        print(
+            f"#guild_config_cache.py | OK | Cached {len(self._modules)} module flags, {len(self._settings)} guild settings, "
+            f"{len(self._cooldown_rules)} cooldown rule sets and {len(self._role_counters)} role counters"
+        )
+        if self.refresh_interval_seconds > 0:
+            self._refresh_task = asyncio.create_task(self._refresh_loop(), name="GuildConfigRefresh")
+
+    async def stop(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval_seconds)
+            try:
+                await self.load()
+            except Exception as e:
+                print(f"#guild_config_cache.py | ERROR | Could not refresh guild configuration: {e}")
+
+    # --- STATISTICS ---
+    def _lookup(self, mapping: dict, key: Hashable, default: Any = None) -> Any:
+        value = mapping.get(key)
+        if value is None:
+            if self._loaded:
+                self.absent += 1
+            else:
+                self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "absent": self.absent, "misses": self.misses}
+
+    # --- READS (no I/O) ---
+    def is_module_enabled(self, guild_id: int, module_name: str) -> bool:
+        flags = self._lookup(self._modules, (guild_id, module_name))
+        return flags is not None and flags[0]
+
+    def module_allows_dm(self, guild_id: int, module_name: str) -> bool:
+        # Enabled and allowed to respond in DMs
+        flags = self._lookup(self._modules, (guild_id, module_name))
+        return flags is not None and flags[0] and flags[1]
+
+    def get_notification_channel_id(self, guild_id: int) -> Optional[int]:
+        return self._lookup(self._settings, guild_id, (None, None))[0]
+
+    def get_welcome_message(self, guild_id: int) -> Optional[str]:
+        return self._lookup(self._settings, guild_id, (None, None))[1]
+
+    def get_cooldown_rules(self, guild_id: int, feature_name: str) -> tuple[tuple[str, int, int], ...]:
+        return self._lookup(self._cooldown_rules, (guild_id, feature_name), ())
+
+    def get_dm_warning_threshold(self, guild_id: int, feature_name: str) -> Optional[int]:
+        return self._lookup(self._dm_thresholds, (guild_id, feature_name))
+
+    def longest_cooldown_seconds(self) -> int:
+        return self._longest_cooldown_seconds
+
+    def get_counter_channel_id(self, guild_id: int, role_id: int) -> Optional[int]:
+        return self._lookup(self._role_counters, (guild_id, role_id))
+
+    def counted_roles(self, guild_id: int) -> frozenset[int]:
+        # Counted role ids of guild - one lookup filters out member events of guilds/roles without counters
+        return self._counted_roles.get(guild_id, frozenset())
+
+    def role_counters(self) -> list[tuple[int, int]]:
+        # All counted (guild_id, role_id) pairs
+        return list(self._role_counters)
+
+    # --- WRITE-THROUGH (admin commands) ---
+    async def set_notification_channel(self, guild_id: int, channel_id: int):
+        async with self._lock:
+            # Using "INSERT ... ON CONFLICT... UPDATE" - safest way, will create new entry or update existing one for such server
+            await self.db.execute(
+                """
+                INSERT INTO guild_settings (guild_id, notification_channel_id) VALUES (?,?)
+                ON CONFLICT(guild_id) DO UPDATE SET notification_channel_id = excluded.notification_channel_id
+                """,
+                (guild_id, channel_id)
+            )
+            welcome_message = self._settings.get(guild_id, (None, None))[1]
+            self._settings[guild_id] = (channel_id, welcome_message)
+
+    async def set_welcome_message(self, guild_id: int, welcome_message: str):
+        async with self._lock:
+            await self.db.execute(
+                """
+                INSERT INTO guild_settings (guild_id, welcome_message) VALUES (?,?)
+                ON CONFLICT(guild_id) DO UPDATE SET welcome_message = excluded.welcome_message
+                """,
+                (guild_id, welcome_message)
+            )
+            channel_id = self._settings.get(guild_id, (None, None))[0]
+            self._settings[guild_id] = (channel_id, welcome_message)
+
+    async def add_role_counter(self, guild_id: int, role_id: int, channel_id: int):
+        async with self._lock:
+            await self.db.execute(
+                "INSERT INTO role_counters (guild_id, role_id, channel_id) VALUES (?, ?, ?)",
+                (guild_id, role_id, channel_id)
+            )
+            self._role_counters[(guild_id, role_id)] = channel_id
+            self._counted_roles[guild_id] = self.counted_roles(guild_id) | {role_id}
+
+    async def remove_role_counter(self, guild_id: int, role_id: int):
+        async with self._lock:
+            await self.db.execute("DELETE FROM role_counters WHERE guild_id = ? AND role_id = ?", (guild_id, role_id))
+            self._role_counters.pop((guild_id, role_id), None)
+            counted = self.counted_roles(guild_id) - {role_id}
+            if counted:
+                self._counted_roles[guild_id] = counted
+            else:
+                self._counted_roles.pop(guild_id, None)
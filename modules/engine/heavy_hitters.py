@@ -0,0 +1,111 @@
+import time
+from collections import deque
+from typing import Hashable, Optional
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy hitters sketch with fixed number of counters.
+    Every item with real count above total/capacity is guaranteed to be kept;
+    reported count overestimates real one by at most reported error.
+    """
+    __slots__ = ("capacity", "counts", "errors")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.counts: dict[Hashable, int] = {}
+        self.errors: dict[Hashable, int] = {}
+
+    def offer(self, item: Hashable, weight: int = 1):
+        if item in self.counts:
+            self.counts[item] += weight
+            return
+        if len(self.counts) < self.capacity:
+            self.counts[item] = weight
+            self.errors[item] = 0
+            return
+        # Replacing item with smallest counter, new one inherits its count as error
+        smallest = min(self.counts, key=self.counts.__getitem__)
+        smallest_count = self.counts.pop(smallest)
+        del self.errors[smallest]
+        self.counts[item] = smallest_count + weight
+        self.errors[item] = smallest_count
+
+
+class OffenderTracker:
+    """
+    Users most often denied by cooldowns, per (guild_id, feature_name).
+    Each key holds one SpaceSaving sketch per time bucket (bucket_seconds, last `buckets` kept),
+    so memory per key is fixed and top offenders can be asked for any window up to buckets * bucket_seconds.
+    """
+    def __init__(self, capacity: int = 32, bucket_seconds: int = 3600, buckets: int = 24):
+        self.capacity = capacity
+        self.bucket_seconds = bucket_seconds
+        self.buckets = buckets
+        self._sketches: dict[int, dict[str, deque[tuple[int, SpaceSaving]]]] = {} # guild_id -> feature_name -> [(bucket_start, sketch)]
+        self._next_eviction = 0
+
+    @property
+    def max_window_seconds(self) -> int:
+        return self.bucket_seconds * self.buckets
+
+    def record(self, guild_id: int, feature_name: str, user_id: int, now: Optional[float] = None):
+        now = time.time() if now is None else now
+        bucket_start = int(now) // self.bucket_seconds * self.bucket_seconds
+
+        features = self._sketches.setdefault(guild_id, {})
+        sketches = features.get(feature_name)
+        if sketches is None:
+            sketches = features[feature_name] = deque(maxlen=self.buckets)
+        if not sketches or sketches[-1][0] != bucket_start:
+            sketches.append((bucket_start, SpaceSaving(self.capacity))) # oldest bucket falls out
+        sketches[-1][1].offer(user_id)
+
+        if now >= self._next_eviction:
+            self._evict_idle(now)
+            self._next_eviction = now + self.bucket_seconds
+
+    def _evict_idle(self, now: float):
+        # Keys without any bucket inside the longest window only take memory
+        oldest_allowed = now - self.max_window_seconds
+        for guild_id in list(self._sketches):
+            features = self._sketches[guild_id]
+            for feature_name in [name for name, sketches in features.items() if sketches[-1][0] + self.bucket_seconds <= oldest_allowed]:
+                del features[feature_name]
+            if not features:
+                del self._sketches[guild_id]
+
+    def top(
+        self,
+        guild_id: int,
+        feature_name: Optional[str] = None,
+        window_seconds: int = 3600,
+        count: int = 10,
+        now: Optional[float] = None
+    ) -> list[tuple[int, int, int]]:
+        """
+        Returns [(user_id, guaranteed_denials, max_denials)], ranked by guaranteed count -
+        users evicted and re-added to sketch (noise) end up at the bottom.
+        Without feature_name all features of guild are merged. Window is rounded to whole buckets.
+        """
+        now = time.time() if now is None else now
+        oldest_bucket = int(now - window_seconds) // self.bucket_seconds * self.bucket_seconds
+
+        counts: dict[int, int] = {}
+        errors: dict[int, int] = {}
+        features = self._sketches.get(guild_id, {})
+        for key_feature, sketches in features.items():
+            if feature_name is not None and key_feature != feature_name:
+                continue
+            for bucket_start, sketch in sketches:
+                if bucket_start < oldest_bucket:
+                    continue
+                for user_id, user_count in sketch.counts.items():
+                    counts[user_id] = counts.get(user_id, 0) + user_count
+                    errors[user_id] = errors.get(user_id, 0) + sketch.errors[user_id]
+
+        ranked = sorted(counts, key=lambda user_id: (errors[user_id] - counts[user_id], -counts[user_id], user_id))[:count]
+        return [(user_id, counts[user_id] - errors[user_id], counts[user_id]) for user_id in ranked]
+
+    def features(self, guild_id: int) -> list[str]:
+        return sorted(self._sketches.get(guild_id, {}))
@@ -0,0 +1,71 @@
+from typing import Iterable
+
+from .database import Database
+
+# Top rows per guild in one pass over user_stats, used only to rebuild after restart
+TOP_PER_GUILD_SQL = """
+    SELECT guild_id, user_id, message_count FROM (
+        SELECT guild_id, user_id, message_count,
+               ROW_NUMBER() OVER (PARTITION BY guild_id ORDER BY message_count DESC, user_id) AS position
+        FROM user_stats
+    )
+    WHERE position <= ?
+"""
+
+
+class ActivityLeaderboard:
+    """
+    Top-N most active users per guild (available as bot.leaderboard).
+    Rebuilt from user_stats on startup, then updated with new totals after every
+    MessageStats flush. Message counts only grow, so user outside top-N can enter it
+    only by passing current last place - keeping N entries per guild is enough to stay exact.
+    Reads are O(1): sorted tuple is prepared when guild's top changes.
+    """
+    def __init__(self, db: Database, size: int = 10):
+        self.db = db
+        self.size = size
+        self._counts: dict[int, dict[int, int]] = {} # guild_id -> {user_id: message_count}, at most size entries
+        self._sorted: dict[int, tuple[tuple[int, int], ...]] = {} # guild_id -> ((user_id, message_count), ...)
+        self._versions: dict[int, int] = {} # guild_id -> change counter, lets readers cache rendered output
+
+    async def load(self):
+        rows = await self.db.fetchall(TOP_PER_GUILD_SQL, (self.size,))
+        self._counts = {}
+        for guild_id, user_id, message_count in rows:
+            self._counts.setdefault(guild_id, {})[user_id] = message_count
+        self._sorted = {}
+        for guild_id in self._counts:
+            self._resort(guild_id)
+
+    def _resort(self, guild_id: int):
+        counts = self._counts[guild_id]
+        self._sorted[guild_id] = tuple(sorted(counts.items(), key=lambda item: (-item[1], item[0])))
+        self._versions[guild_id] = self._versions.get(guild_id, 0) + 1
+
+    def apply(self, totals: Iterable[tuple[int, int, int]]):
+        """
+        Takes (user_id, guild_id, new message_count) rows, as written to user_stats.
+        """
+        changed = set()
+        for user_id, guild_id, message_count in totals:
+            counts = self._counts.setdefault(guild_id, {})
+            if user_id in counts:
+                counts[user_id] = message_count
+            elif len(counts) < self.size:
+                counts[user_id] = message_count
+            else:
+                last_user = min(counts, key=lambda user: (counts[user], -user))
+                if message_count <= counts[last_user]:
+                    continue
+                del counts[last_user]
+                counts[user_id] = message_count
+            changed.add(guild_id)
+
+        for guild_id in changed:
+            self._resort(guild_id)
+
+    def top(self, guild_id: int) -> tuple[tuple[int, int], ...]:
+        return self._sorted.get(guild_id, ())
+
+    def version(self, guild_id: int) -> int:
+        return self._versions.get(guild_id, 0)
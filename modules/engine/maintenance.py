@@ -0,0 +1,81 @@
+import asyncio
+import time
+from discord.ext import commands, tasks
+
+from .cooldown_manager import now_ms
+
+HOUR_MS = 3600 * 1000
+
+# Moves one batch of old command_usage rows into hourly rollup. Both statements select
+# the same rows (oldest ids first), so rollup and delete always match inside transaction.
+ROLLUP_BATCH_SQL = """
+    INSERT INTO command_usage_hourly (guild_id, feature_name, hour_start, usage_count)
+    SELECT guild_id, feature_name, (timestamp / 3600000) * 3600000, COUNT(*)
+    FROM command_usage
+    WHERE id IN (SELECT id FROM command_usage WHERE timestamp < ? ORDER BY id LIMIT ?)
+    GROUP BY guild_id, feature_name, timestamp / 3600000
+    ON CONFLICT (guild_id, feature_name, hour_start)
+    DO UPDATE SET usage_count = usage_count + excluded.usage_count
+"""
+DELETE_BATCH_SQL = "DELETE FROM command_usage WHERE id IN (SELECT id FROM command_usage WHERE timestamp < ? ORDER BY id LIMIT ?)"
+
+
+class DatabaseMaintenance(commands.Cog):
+    """
+    Background database upkeep.
+    command_usage rows older than retention window are collapsed into command_usage_hourly
+    (guild, feature, hour) and deleted in small batches, so the writer is never blocked for long.
+    """
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        settings = self.bot.config.get("database", {})
+        self.retention_hours = settings.get("usage_retention_hours", 0) # 0 = only longest cooldown period
+        self.batch_size = settings.get("prune_batch_size", 5000)
+        self.batch_pause = settings.get("prune_batch_pause_ms", 50) / 1000
+
+        self.prune_usage.change_interval(minutes=settings.get("maintenance_interval_minutes", 60))
+        self.prune_usage.start()
+
+    def cog_unload(self):
+        self.prune_usage.cancel()
+
+    async def retention_cutoff_ms(self) -> int:
+        # Rows needed by any cooldown rule are never removed, even if configured retention is shorter
+        longest_period_ms = self.bot.guild_config.longest_cooldown_seconds() * 1000
+        retention_ms = max(self.retention_hours * HOUR_MS, longest_period_ms)
+        return now_ms() - retention_ms
+
+    async def rollup_old_usage(self) -> int:
+        # Returns number of moved rows
+        cutoff = await self.retention_cutoff_ms()
+        moved = 0
+        while True:
+            async def work(conn) -> int:
+                await conn.execute(ROLLUP_BATCH_SQL, (cutoff, self.batch_size))
+                async with conn.execute(DELETE_BATCH_SQL, (cutoff, self.batch_size)) as cursor:
+                    return cursor.rowcount
+
+            deleted = await self.bot.db.transaction(work)
+            moved += deleted
+            if deleted < self.batch_size:
+                return moved
+            await asyncio.sleep(self.batch_pause) # let other writes go between batches
+
+    @tasks.loop(minutes=60) # This value is default, will be overwritten in __init__
+    async def prune_usage(self):
+        start = time.perf_counter()
+        try:
+            moved = await self.rollup_old_usage()
+            if moved:
+                elapsed = time.perf_counter() - start
+                print(f"#maintenance.py | OK | Rolled up {moved} old command_usage rows into hourly stats in {elapsed:.2f}s")
+        except Exception as e:
+            print(f"#maintenance.py | ERROR | command_usage retention failed: {e}")
+
+    @prune_usage.before_loop
+    async def before_prune_usage(self):
+        await self.bot.wait_until_ready()
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(DatabaseMaintenance(bot))
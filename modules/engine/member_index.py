@@ -0,0 +1,69 @@
+import discord
+from discord.ext import commands
+
+
+class MemberGuildIndex(commands.Cog):
+    """
+    Index user_id -> set of guild_ids shared with bot (available as bot.member_index).
+    Built from member cache on ready and kept current with member/guild events,
+    so "which guilds does this user share with bot" costs O(mutual guilds), not O(all guilds).
+    """
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self._guilds_by_user: dict[int, set[int]] = {}
+
+    # --- READS ---
+    def guilds_for_user(self, user_id: int) -> frozenset[int]:
+        return frozenset(self._guilds_by_user.get(user_id, ()))
+
+    def __len__(self) -> int:
+        return len(self._guilds_by_user)
+
+    # --- MAINTENANCE ---
+    def _add(self, user_id: int, guild_id: int):
+        self._guilds_by_user.setdefault(user_id, set()).add(guild_id)
+
+    def _discard(self, user_id: int, guild_id: int):
+        guild_ids = self._guilds_by_user.get(user_id)
+        if guild_ids is None:
+            return
+        guild_ids.discard(guild_id)
+        if not guild_ids:
+            del self._guilds_by_user[user_id]
+
+    def add_guild(self, guild: discord.Guild):
+        for member in guild.members:
+            self._add(member.id, guild.id)
+
+    def remove_guild(self, guild_id: int):
+        for user_id in [user_id for user_id, guild_ids in self._guilds_by_user.items() if guild_id in guild_ids]:
+            self._discard(user_id, guild_id)
+
+    def rebuild(self):
+        self._guilds_by_user = {}
+        for guild in self.bot.guilds:
+            self.add_guild(guild)
+
+    # --- EVENTS ---
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # on_ready fires again after reconnect, member cache could change in meantime
+        self.rebuild()
+        print(f"#member_index.py | OK | Indexed {len(self._guilds_by_user)} users across {len(self.bot.guilds)} guilds")
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        self.add_guild(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.remove_guild(guild.id)
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self._add(member.id, member.guild.id)
+
+    @commands.Cog.listener()
+    async def on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent):
+        # Raw event - delivered also for members missing from cache
+        self._discard(payload.user.id, payload.guild_id)
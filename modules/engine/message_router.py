@@ -0,0 +1,75 @@
+import asyncio
+from typing import Awaitable, Callable, Optional
+
+import discord
+from discord.ext import commands
+
+from .fair_scheduler import PRIORITY_LOW, FairScheduler
+
+
+class RoutedMessage:
+    """
+    Message normalized once by MessageRouter. Shared features are computed
+    here, so matchers don't lowercase/scan the same content again.
+    """
+    __slots__ = ("message", "guild_id", "content_lower", "is_bot_mentioned", "is_question", "length")
+
+    def __init__(self, message: discord.Message, bot_user_id: int):
+        self.message = message
+        self.guild_id: Optional[int] = message.guild.id if message.guild else None # None in DMs
+        self.content_lower = message.content.lower()
+        self.is_bot_mentioned = any(user.id == bot_user_id for user in message.mentions)
+        self.is_question = message.content.rstrip().endswith('?')
+        self.length = len(message.content)
+
+
+# Predicate is synchronous and cheap (no I/O) - it rejects message before any async work is started
+MessagePredicate = Callable[[RoutedMessage], bool]
+MessageHandler = Callable[[RoutedMessage], Awaitable[None]]
+
+
+class MessageRouter(commands.Cog):
+    """
+    Single on_message listener for message-driven features (available as bot.message_router).
+    Modules register matcher (predicate + handler) in cog_load and unregister in cog_unload.
+    Accepted messages are processed through FairScheduler, per guild, with priority
+    of the most important matcher. Prefix commands are still processed by commands.Bot itself.
+    """
+    def __init__(self, bot: commands.Bot, scheduler: FairScheduler):
+        self.bot = bot
+        self.scheduler = scheduler
+        self._matchers: dict[str, tuple[MessagePredicate, MessageHandler, int]] = {}
+
+    def register(self, name: str, predicate: MessagePredicate, handler: MessageHandler, priority: int = PRIORITY_LOW):
+        self._matchers[name] = (predicate, handler, priority)
+
+    def unregister(self, name: str):
+        self._matchers.pop(name, None)
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        if message.author.bot or not self._matchers:
+            return
+
+        routed = RoutedMessage(message, self.bot.user.id)
+        selected = []
+        priority = PRIORITY_LOW
+        for name, (predicate, handler, matcher_priority) in self._matchers.items():
+            try:
+                if predicate(routed):
+                    selected.append((name, handler))
+                    priority = min(priority, matcher_priority)
+            except Exception as e:
+                print(f"#message_router.py | ERROR | Matcher '{name}' predicate failed: {type(e).__name__}: {e}")
+
+        if not selected:
+            return
+        # Over budget guild has its message shed here, before any async work
+        self.scheduler.submit(routed.guild_id, lambda: self._dispatch(routed, selected), priority)
+
+    async def _dispatch(self, routed: RoutedMessage, selected: list[tuple[str, MessageHandler]]):
+        # Handlers are independent, one slow reply doesn't hold the others
+        results = await asyncio.gather(*(handler(routed) for _, handler in selected), return_exceptions=True)
+        for (name, _), result in zip(selected, results):
+            if isinstance(result, Exception):
+                print(f"#message_router.py | ERROR | Matcher '{name}' failed: {type(result).__name__}: {result}")
@@ -0,0 +1,121 @@
+import asyncio
+import time
+from typing import Optional
+
+import discord
+from discord.ext import commands
+
+from .database import Database
+from .leaderboard import ActivityLeaderboard
+
+UPSERT_MESSAGE_COUNT_SQL = """
+    INSERT INTO user_stats (user_id, guild_id, message_count)
+    VALUES (?, ?, ?)
+    ON CONFLICT(user_id, guild_id)
+    DO UPDATE SET message_count = message_count + excluded.message_count
+"""
+TOTALS_CHUNK = 400 # (user_id, guild_id) pairs per totals query, 2 parameters each
+
+
+class MessageStats(commands.Cog):
+    """
+    Message counting into user_stats (available as bot.message_stats).
+    Every guild message only increments in-memory counter (dictionary, no I/O),
+    pending counts are written as one batched UPSERT every flush_interval_seconds and on shutdown.
+    New totals of flushed rows are passed to leaderboard (if given).
+    """
+    def __init__(self, bot: commands.Bot, db: Database, flush_interval_seconds: int = 30, leaderboard: Optional[ActivityLeaderboard] = None):
+        self.bot = bot
+        self.db = db
+        self.flush_interval_seconds = flush_interval_seconds
+        self.leaderboard = leaderboard
+
+        self._pending: dict[tuple[int, int], int] = {} # (user_id, guild_id) -> messages since last flush
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Counters
+        self.flushes = 0
+        self.rows_flushed = 0
+        self.last_flush_ms = 0.0
+
+    # --- COUNTING ---
+    def increment(self, user_id: int, guild_id: int, count: int = 1):
+        key = (user_id, guild_id)
+        self._pending[key] = self._pending.get(key, 0) + count
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        if message.author.bot or not message.guild:
+            return
+        self.increment(message.author.id, message.guild.id)
+
+    # --- LIFECYCLE ---
+    async def start(self):
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop(), name="MessageStatsFlush")
+
+    async def stop(self):
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+        print(f"#message_stats.py | OK | Message counters flushed on shutdown ({self.rows_flushed} rows written in total)")
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            await self.flush()
+
+    async def flush(self):
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, {}
+            rows = [(user_id, guild_id, count) for (user_id, guild_id), count in batch.items()]
+
+            async def work(conn) -> list:
+                cursor = await conn.executemany(UPSERT_MESSAGE_COUNT_SQL, rows)
+                await cursor.close()
+                if self.leaderboard is None:
+                    return []
+                # Reading back totals in the same transaction - only touched rows, by primary key
+                totals = []
+                for offset in range(0, len(rows), TOTALS_CHUNK):
+                    chunk = rows[offset:offset + TOTALS_CHUNK]
+                    placeholders = ", ".join("(?, ?)" for _ in chunk)
+                    params = [value for user_id, guild_id, _ in chunk for value in (user_id, guild_id)]
+                    async with conn.execute(
+                        f"SELECT user_id, guild_id, message_count FROM user_stats WHERE (user_id, guild_id) IN (VALUES {placeholders})",
+                        params
+                    ) as cursor:
+                        totals.extend(await cursor.fetchall())
+                return totals
+
+            start = time.perf_counter()
+            try:
+                totals = await self.db.transaction(work)
+            except Exception as e:
+                # Counts are not lost - merged back and written with next flush
+                for (user_id, guild_id), count in batch.items():
+                    self.increment(user_id, guild_id, count)
+                print(f"#message_stats.py | ERROR | Could not flush {len(rows)} message counters: {e}")
+                return
+
+            self.flushes += 1
+            self.rows_flushed += len(rows)
+            self.last_flush_ms = (time.perf_counter() - start) * 1000
+            if self.leaderboard is not None:
+                self.leaderboard.apply(totals)
+
+    def stats(self) -> dict:
+        return {
+            "pending_rows": len(self._pending),
+            "flushes": self.flushes,
+            "rows_flushed": self.rows_flushed,
+            "last_flush_ms": round(self.last_flush_ms, 2),
+        }
@@ -0,0 +1,293 @@
+import aiosqlite
+
+# ==============================================================================
+# SCHEMA MIGRATIONS
+# PRAGMA user_version holds number of last applied migration.
+# Migrations are applied in order, all pending ones in one transaction.
+# Never edit migration which could be already applied - add new one at the end.
+# ==============================================================================
+
+MIGRATIONS: list[tuple[int, str, list[str]]] = [
+    (1, "Base schema", [
+        # --- STATISTICS TABLES  ---
+        ## Table for user stats
+        """
+        CREATE TABLE IF NOT EXISTS user_stats (
+            user_id INTEGER NOT NULL,
+            guild_id INTEGER NOT NULL,
+            message_count INTEGER DEFAULT 0,
+            PRIMARY KEY (user_id, guild_id)
+        )
+        """,
+        ## Table for commands usage stats
+        """
+        CREATE TABLE IF NOT EXISTS command_usage (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            guild_id INTEGER NOT NULL,
+            feature_name TEXT NOT NULL,
+            timestamp TEXT NOT NULL
+        )
+        """,
+
+        # --- LANGUAGE SETTINGS ---
+        # Table for language settings per guild
+        """
+        CREATE TABLE IF NOT EXISTS guild_language(
+            guild_id INTEGER PRIMARY KEY,
+            language_code TEXT NOT NULL DEFAULT 'en'
+        )
+        """,
+        # Table for language settings per user
+        """
+        CREATE TABLE IF NOT EXISTS user_language(
+            user_id INTEGER PRIMARY KEY,
+            language_code TEXT NOT NULL
+        )
+        """,
+        # Table for custom server translations
+        """
+        CREATE TABLE IF NOT EXISTS custom_translations (
+            translation_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL,
+            translation_key TEXT NOT NULL,
+            custom_text TEXT NOT NULL,
+            UNIQUE (guild_id, translation_key)
+        )
+        """,
+
+        # --- COOLDOWNS/WARNIGNS ---
+        # Table for cooldown warnings
+        """
+        CREATE TABLE IF NOT EXISTS cooldown_warnings (
+            user_id INTEGER NOT NULL,
+            guild_id INTEGER NOT NULL,
+            feature_name TEXT NOT NULL,
+            warning_level INTEGER DEFAULT 0,
+            PRIMARY KEY (user_id, guild_id, feature_name)
+        )
+        """,
+
+        # --- GUILD SETTINGS ---
+        # Table for enabling/disabling modules per server
+        """
+        CREATE TABLE IF NOT EXISTS guild_modules (
+            guild_id INTEGER NOT NULL,
+            module_name TEXT NOT NULL,
+            is_enabled BOOLEAN NOT NULL DEFAULT 1,
+            allow_in_dm BOOLEAN NOT NULL DEFAULT 1,
+            dm_warning_threshld INTEGER,
+            PRIMARY KEY (guild_id, module_name)
+        )
+        """,
+        # Table for guild settings(notification channel for now)
+        """
+        CREATE TABLE IF NOT EXISTS guild_settings (
+            guild_id INTEGER PRIMARY KEY,
+            notification_channel_id INTEGER,
+            welcome_message TEXT
+        )
+        """,
+        ## Table for role users counters
+        """
+        CREATE TABLE IF NOT EXISTS role_counters (
+            guild_id INTEGER NOT NULL,
+            role_id INTEGER NOT NULL,
+            channel_id INTEGER NOT NULL,
+            PRIMARY KEY (guild_id, role_id)
+        )
+        """,
+        # Table for bot responses(ex. Honk - bot will respond "HONK!" as message)
+        """
+        CREATE TABLE IF NOT EXISTS guild_responses (
+            response_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL,
+            trigger_text TEXT NOT NULL,
+            response_text TEXT NOT NULL,
+            UNIQUE (guild_id, trigger_text)
+        )
+        """,
+        # Table for jokes
+        """
+        CREATE TABLE IF NOT EXISTS jokes (
+            joke_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL,
+            category TEXT NOT NULL,
+            text TEXT NOT NULL,
+            UNIQUE (guild_id, text)
+        )
+        """,
+        # Table for cooldowns management
+        """
+        CREATE TABLE IF NOT EXISTS guild_cooldowns (
+            cooldown_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL,
+            feature_name TEXT NOT NULL,
+            limit_name TEXT,
+            limit_count INTEGER NOT NULL,
+            period_seconds INTEGER NOT NULL,
+            dm_warning_threshold INTEGER,
+            UNIQUE (guild_id, feature_name, period_seconds)
+        )
+        """,
+
+        # --- ROLE MANAGEMENT ---
+        # Table which saves "role groups" to be choosen
+        """
+        CREATE TABLE IF NOT EXISTS role_groups (
+            group_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL,
+            group_name TEXT NOT NULL,
+            group_description TEXT,
+            UNIQUE (guild_id, group_name)
+        )
+        """,
+        # Table for which roles can be chosen for each privileged group
+        """
+        CREATE TABLE IF NOT EXISTS selectable_roles (
+            selectable_role_id INTEGER PRIMARY KEY,
+            guild_id INTEGER NOT NULL,
+            group_id INTEGER NOT NULL,
+            role_id INTEGER NOT NULL,
+            role_description TEXT,
+            UNIQUE (group_id, role_id),
+            FOREIGN KEY (group_id) REFERENCES role_groups (group_id) ON DELETE CASCADE
+        )
+        """,
+        # Table to change permissions for roles.
+        """
+        CREATE TABLE IF NOT EXISTS role_group_permissions (
+            permission_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL,
+            required_role_id INTEGER NOT NULL,
+            group_id INTEGER NOT NULL,
+            UNIQUE (guild_id, required_role_id, group_id)
+            FOREIGN KEY (group_id) REFERENCES role_groups (group_id) on DELETE CASCADE
+        )
+        """,
+    ]),
+
+    (2, "Fix dm_warning_threshld column name in guild_modules", [
+        "ALTER TABLE guild_modules RENAME COLUMN dm_warning_threshld TO dm_warning_threshold",
+    ]),
+
+    (3, "Indexes for hot queries", [
+        # Cooldown checks: equality on guild/user/feature, range on timestamp
+        "CREATE INDEX IF NOT EXISTS idx_command_usage_lookup ON command_usage (guild_id, user_id, feature_name, timestamp)",
+        # Jokes by category. guild_responses(guild_id, trigger_text) is already covered by its UNIQUE index
+        "CREATE INDEX IF NOT EXISTS idx_jokes_guild_category ON jokes (guild_id, category)",
+    ]),
+
+    (4, "command_usage.timestamp as integer epoch milliseconds", [
+        # Column affinity can't be changed in place - table is rebuilt, ISO-8601 rows are converted
+        """
+        CREATE TABLE command_usage_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            guild_id INTEGER NOT NULL,
+            feature_name TEXT NOT NULL,
+            timestamp INTEGER NOT NULL
+        )
+        """,
+        """
+        INSERT INTO command_usage_new (id, user_id, guild_id, feature_name, timestamp)
+        SELECT id, user_id, guild_id, feature_name,
+               CAST(ROUND((julianday(timestamp) - 2440587.5) * 86400000.0) AS INTEGER)
+        FROM command_usage
+        WHERE julianday(timestamp) IS NOT NULL
+        """,
+        "DROP TABLE command_usage",
+        "ALTER TABLE command_usage_new RENAME TO command_usage",
+        "CREATE INDEX idx_command_usage_lookup ON command_usage (guild_id, user_id, feature_name, timestamp)",
+    ]),
+
+    (5, "Hourly rollup of old command_usage rows", [
+        """
+        CREATE TABLE IF NOT EXISTS command_usage_hourly (
+            guild_id INTEGER NOT NULL,
+            feature_name TEXT NOT NULL,
+            hour_start INTEGER NOT NULL,
+            usage_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (guild_id, feature_name, hour_start)
+        )
+        """,
+    ]),
+
+    (6, "Match mode for auto-responder triggers", [
+        # 'exact' (whole message), 'word' (on word boundaries) or 'substring'
+        "ALTER TABLE guild_responses ADD COLUMN match_mode TEXT NOT NULL DEFAULT 'exact'",
+    ]),
+
+    (7, "Per-guild swear and punchline packs", [
+        # kind: 'swear' or 'punchline'. UNIQUE index also serves lookups by guild_id
+        """
+        CREATE TABLE IF NOT EXISTS swearer_entries (
+            entry_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL,
+            kind TEXT NOT NULL,
+            text TEXT NOT NULL,
+            UNIQUE (guild_id, kind, text)
+        )
+        """,
+    ]),
+
+    (8, "Bulk role assignment jobs", [
+        # Members are processed in user_id order, last_user_id is the resume point after restart.
+        # action: 'add' / 'remove', target_type: 'all' / 'role' / 'group' (target_id is role_id or group_id)
+        """
+        CREATE TABLE IF NOT EXISTS role_bulk_jobs (
+            job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL,
+            role_id INTEGER NOT NULL,
+            action TEXT NOT NULL,
+            target_type TEXT NOT NULL,
+            target_id INTEGER,
+            requested_by INTEGER NOT NULL,
+            status TEXT NOT NULL DEFAULT 'running',
+            last_user_id INTEGER NOT NULL DEFAULT 0,
+            total INTEGER NOT NULL DEFAULT 0,
+            processed INTEGER NOT NULL DEFAULT 0,
+            failed INTEGER NOT NULL DEFAULT 0,
+            created_at INTEGER NOT NULL,
+            updated_at INTEGER NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_role_bulk_jobs_status ON role_bulk_jobs (status)",
+        "CREATE INDEX IF NOT EXISTS idx_role_bulk_jobs_guild ON role_bulk_jobs (guild_id, job_id)",
+    ]),
+
+    (9, "Reason of failed bulk role jobs", [
+        "ALTER TABLE role_bulk_jobs ADD COLUMN error TEXT",
+    ]),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+async def get_schema_version(db: aiosqlite.Connection) -> int:
+    async with db.execute("PRAGMA user_version") as cursor:
+        return (await cursor.fetchone())[0]
+
+
+async def apply_migrations(db: aiosqlite.Connection) -> int:
+    """
+    Applies all pending migrations in one transaction and returns number of applied ones.
+    If schema is already current nothing else than PRAGMA user_version is executed.
+    """
+    current_version = await get_schema_version(db)
+    if current_version >= LATEST_VERSION:
+        return 0
+
+    pending = [migration for migration in MIGRATIONS if migration[0] > current_version]
+    await db.execute("BEGIN IMMEDIATE")
+    try:
+        for version, description, statements in pending:
+            for statement in statements:
+                await db.execute(statement)
+            print(f"#migrations.py | Info | Applied migration {version}: {description}")
+        await db.execute(f"PRAGMA user_version = {LATEST_VERSION}")
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return len(pending)
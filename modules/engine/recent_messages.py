@@ -0,0 +1,125 @@
+import time
+from collections import OrderedDict, deque
+from typing import Optional
+
+import discord
+from discord.ext import commands
+
+
+class RecentMessage:
+    __slots__ = ("message_id", "author_id", "is_bot", "clean_content")
+
+    def __init__(self, message_id: int, author_id: int, is_bot: bool, clean_content: str):
+        self.message_id = message_id
+        self.author_id = author_id
+        self.is_bot = is_bot
+        self.clean_content = clean_content
+
+
+class RecentMessageCache(commands.Cog):
+    """
+    Last few eligible messages per channel (available as bot.recent_messages), filled from gateway events.
+    Eligible = written by user or by this bot, with non-empty content - what /sra and /swearer work on.
+    Memory is capped: per_channel messages in max_channels channels, least recently active
+    channels and channels idle longer than idle_seconds are evicted.
+    """
+    def __init__(self, bot: commands.Bot, per_channel: int = 10, max_channels: int = 1000, idle_seconds: int = 3600):
+        self.bot = bot
+        self.per_channel = per_channel
+        self.max_channels = max_channels
+        self.idle_seconds = idle_seconds
+        self._channels: OrderedDict[int, tuple[float, deque[RecentMessage]]] = OrderedDict() # channel_id -> (last activity, messages)
+        self.hits = 0
+        self.misses = 0
+
+    # --- READS ---
+    def latest_text(self, channel_id: int) -> Optional[str]:
+        """
+        Clean content of newest eligible message in channel, None if channel is not buffered
+        (caller falls back to channel history then).
+        """
+        entry = self._channels.get(channel_id)
+        if entry is None or not entry[1]:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1][-1].clean_content
+
+    def stats(self) -> dict:
+        return {
+            "channels": len(self._channels),
+            "messages": sum(len(messages) for _, messages in self._channels.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    # --- MAINTENANCE ---
+    def _is_eligible(self, message: discord.Message) -> bool:
+        return bool(message.content) and (not message.author.bot or message.author.id == self.bot.user.id)
+
+    def add(self, message: discord.Message):
+        if not self._is_eligible(message):
+            return
+        clean_content = message.clean_content
+        if not clean_content:
+            return
+
+        now = time.monotonic()
+        channel_id = message.channel.id
+        entry = self._channels.pop(channel_id, None)
+        messages = entry[1] if entry is not None else deque(maxlen=self.per_channel)
+        messages.append(RecentMessage(message.id, message.author.id, message.author.bot, clean_content))
+        self._channels[channel_id] = (now, messages) # most recently active at the end
+
+        # Oldest channels are at the front - evicting while over limit or idle, amortized O(1)
+        while self._channels:
+            oldest_id, (last_activity, _) = next(iter(self._channels.items()))
+            if len(self._channels) <= self.max_channels and now - last_activity <= self.idle_seconds:
+                break
+            del self._channels[oldest_id]
+
+    def _find(self, channel_id: int, message_id: int) -> tuple[Optional[deque], int]:
+        entry = self._channels.get(channel_id)
+        if entry is None:
+            return None, -1
+        for index, recent in enumerate(entry[1]):
+            if recent.message_id == message_id:
+                return entry[1], index
+        return None, -1
+
+    # --- EVENTS ---
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        self.add(message)
+
+    def remove(self, channel_id: int, message_id: int):
+        messages, index = self._find(channel_id, message_id)
+        if messages is not None:
+            del messages[index]
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        self.remove(payload.channel_id, payload.message_id)
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        # Purged messages must not be reposted by /sra or /swearer
+        if payload.channel_id not in self._channels:
+            return
+        for message_id in payload.message_ids:
+            self.remove(payload.channel_id, message_id)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self._channels.pop(channel.id, None)
+
+    @commands.Cog.listener()
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
+        messages, index = self._find(payload.channel_id, payload.message_id)
+        if messages is None:
+            return
+        clean_content = payload.message.clean_content
+        if clean_content:
+            messages[index].clean_content = clean_content
+        else:
+            del messages[index]
@@ -0,0 +1,100 @@
+import asyncio
+import time
+from collections import deque
+from typing import Optional
+
+import discord
+
+
+class _ChannelState:
+    __slots__ = ("name", "reason", "renames", "task")
+
+    def __init__(self):
+        self.name: Optional[str] = None # latest requested name, None when nothing is waiting
+        self.reason: Optional[str] = None
+        self.renames: deque[float] = deque() # monotonic times of renames inside current window
+        self.task: Optional[asyncio.Task] = None
+
+
+class ChannelRenameDebouncer:
+    """
+    Coalescing channel renames. Discord allows only renames_per_window renames of a channel
+    per window_seconds, further ones wait in discord.py's rate limiter and hold other REST calls.
+    request() only stores latest name of channel; one task per channel waits delay_seconds
+    (so bursts collapse into one rename) and for free slot in rate limit window, then renames
+    to whatever name is latest at that moment. Last requested name is always applied.
+    """
+    def __init__(self, bot: discord.Client, renames_per_window: int = 2, window_seconds: float = 600, delay_seconds: float = 5):
+        self.bot = bot
+        self.renames_per_window = renames_per_window
+        self.window_seconds = window_seconds
+        self.delay_seconds = delay_seconds
+        self._channels: dict[int, _ChannelState] = {} # channel_id -> state
+
+        # Counters
+        self.requests = 0
+        self.renames = 0
+
+    def request(self, channel_id: int, name: str, reason: Optional[str] = None):
+        self.requests += 1
+        state = self._channels.get(channel_id)
+        if state is None:
+            state = self._channels[channel_id] = _ChannelState()
+        state.name = name
+        state.reason = reason
+        if state.task is None:
+            state.task = asyncio.create_task(self._run(channel_id, state), name=f"RenameChannel-{channel_id}")
+
+    def cancel(self, channel_id: int):
+        # Channel is being removed, waiting rename is not needed anymore
+        state = self._channels.pop(channel_id, None)
+        if state is not None and state.task is not None:
+            state.task.cancel()
+
+    def stop(self):
+        for state in self._channels.values():
+            if state.task is not None:
+                state.task.cancel()
+        self._channels.clear()
+
+    def _wait_time(self, state: _ChannelState) -> float:
+        now = time.monotonic()
+        while state.renames and state.renames[0] + self.window_seconds <= now:
+            state.renames.popleft()
+        if len(state.renames) < self.renames_per_window:
+            return 0.0
+        return state.renames[0] + self.window_seconds - now
+
+    async def _run(self, channel_id: int, state: _ChannelState):
+        try:
+            while state.name is not None:
+                await asyncio.sleep(max(self.delay_seconds, self._wait_time(state)))
+                name, reason = state.name, state.reason
+                state.name = None # requests made during rename start next round
+
+                channel = self.bot.get_channel(channel_id)
+                if channel is None or channel.name == name:
+                    continue
+                try:
+                    await channel.edit(name=name, reason=reason)
+                    state.renames.append(time.monotonic())
+                    self.renames += 1
+                except discord.errors.NotFound:
+                    break
+                except discord.errors.Forbidden:
+                    print(f"#rename_debouncer.py | Error! | No privileges to rename channel {channel.name} on server {channel.guild.name}")
+                except discord.HTTPException as e:
+                    print(f"#rename_debouncer.py | ERROR | Could not rename channel {channel_id}: {e}")
+        finally:
+            state.task = None
+            # Rename history is kept (counted channels are few), it limits next renames
+            if not state.renames and self._channels.get(channel_id) is state:
+                del self._channels[channel_id]
+
+    def stats(self) -> dict:
+        return {
+            "channels": len(self._channels),
+            "waiting": sum(1 for state in self._channels.values() if state.name is not None),
+            "requests": self.requests,
+            "renames": self.renames,
+        }
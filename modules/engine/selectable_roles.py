@@ -0,0 +1,74 @@
+from typing import Iterable
+
+from .database import Database
+
+# Only rows of existing groups - foreign keys are not enforced, so rows of deleted groups may stay behind
+SELECTABLE_ROLES_SQL = """
+    SELECT rgp.required_role_id, sr.role_id, sr.role_description
+    FROM role_group_permissions rgp
+    JOIN role_groups rg ON rg.group_id = rgp.group_id
+    JOIN selectable_roles sr ON sr.group_id = rgp.group_id
+    WHERE rgp.guild_id = ?
+    ORDER BY sr.selectable_role_id
+"""
+
+
+class GuildSelectableRoles:
+    __slots__ = ("by_required_role", "descriptions", "order")
+
+    def __init__(self, rows: Iterable):
+        by_required_role: dict[int, set[int]] = {}
+        self.descriptions: dict[int, str] = {} # role_id -> description (first one, if role is in many groups)
+        self.order: dict[int, int] = {} # role_id -> position in panel
+        for required_role_id, role_id, description in rows:
+            by_required_role.setdefault(required_role_id, set()).add(role_id)
+            if role_id not in self.order:
+                self.order[role_id] = len(self.order)
+                self.descriptions[role_id] = description
+        self.by_required_role: dict[int, frozenset[int]] = {role_id: frozenset(roles) for role_id, roles in by_required_role.items()}
+
+    def for_roles(self, member_role_ids: Iterable[int]) -> list[tuple[int, str]]:
+        # Union of selectable roles over member's roles, in panel order
+        selectable = set()
+        for role_id in member_role_ids:
+            roles = self.by_required_role.get(role_id)
+            if roles:
+                selectable |= roles
+        return [(role_id, self.descriptions[role_id]) for role_id in sorted(selectable, key=self.order.__getitem__)]
+
+
+class SelectableRoleCache:
+    """
+    Per-guild map required role -> selectable roles for /role panel (available as bot.selectable_roles).
+    Guild is loaded with one query on first use, RolePanelAdmin commands invalidate edited guild.
+    """
+    def __init__(self, db: Database):
+        self.db = db
+        self._guilds: dict[int, GuildSelectableRoles] = {}
+
+        # Counters
+        self.hits = 0
+        self.loads = 0
+
+    async def get(self, guild_id: int) -> GuildSelectableRoles:
+        guild_roles = self._guilds.get(guild_id)
+        if guild_roles is not None:
+            self.hits += 1
+            return guild_roles
+        rows = await self.db.fetchall(SELECTABLE_ROLES_SQL, (guild_id,))
+        guild_roles = self._guilds[guild_id] = GuildSelectableRoles(rows)
+        self.loads += 1
+        return guild_roles
+
+    async def roles_for(self, guild_id: int, member_role_ids: Iterable[int]) -> list[tuple[int, str]]:
+        return (await self.get(guild_id)).for_roles(member_role_ids)
+
+    def invalidate(self, guild_id: int):
+        self._guilds.pop(guild_id, None)
+
+    def stats(self) -> dict:
+        return {
+            "cached_guilds": len(self._guilds),
+            "hits": self.hits,
+            "loads": self.loads,
+        }
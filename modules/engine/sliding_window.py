@@ -0,0 +1,61 @@
+from array import array
+from bisect import bisect_left, insort
+from typing import Hashable, Iterable
+
+
+class SlidingWindowStore:
+    """
+    In-memory usage timestamps (epoch ms) per key, e.g. (user_id, guild_id, feature_name).
+    Each key holds compact sorted array of 64-bit integers, so number of usages in any
+    window is found with binary search in O(log n), without touching database.
+    """
+    def __init__(self, retention_ms: int):
+        self.retention_ms = retention_ms # Usages older than longest rule period are useless
+        self._windows: dict[Hashable, array] = {}
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def total_entries(self) -> int:
+        return sum(len(window) for window in self._windows.values())
+
+    def add(self, key: Hashable, timestamp_ms: int):
+        window = self._windows.get(key)
+        if window is None:
+            window = self._windows[key] = array('q')
+
+        if not window or window[-1] <= timestamp_ms:
+            window.append(timestamp_ms) # Usual case - time only goes forward
+        else:
+            insort(window, timestamp_ms)
+
+        # Dropping expired prefix, amortized as it happens only once per expired entry
+        oldest_allowed = timestamp_ms - self.retention_ms
+        if window[0] < oldest_allowed:
+            del window[:bisect_left(window, oldest_allowed)]
+
+    def counts_since(self, key: Hashable, window_starts: Iterable[int]) -> list[int]:
+        # Returns number of usages with timestamp >= start, for every start
+        window = self._windows.get(key)
+        if not window:
+            return [0 for _ in window_starts]
+        size = len(window)
+        return [size - bisect_left(window, start) for start in window_starts]
+
+    def evict_idle(self, now_ms: int) -> int:
+        """
+        Removes keys without any usage inside retention period and trims the rest.
+        Returns number of evicted keys.
+        """
+        oldest_allowed = now_ms - self.retention_ms
+        idle_keys = [key for key, window in self._windows.items() if not window or window[-1] < oldest_allowed]
+        for key in idle_keys:
+            del self._windows[key]
+
+        for window in self._windows.values():
+            if window[0] < oldest_allowed:
+                del window[:bisect_left(window, oldest_allowed)]
+        return len(idle_keys)
+
+    def clear(self):
+        self._windows.clear()
@@ -0,0 +1,113 @@
+import json
+import time
+from typing import Optional
+
+from .database import Database
+
+KIND_SWEAR = "swear"
+KIND_PUNCHLINE = "punchline"
+KINDS = (KIND_SWEAR, KIND_PUNCHLINE)
+
+
+class SwearPack:
+    __slots__ = ("swears", "punchlines", "loaded_at")
+
+    def __init__(self, swears: tuple[str, ...] = (), punchlines: tuple[str, ...] = (), loaded_at: float = 0.0):
+        self.swears = swears
+        self.punchlines = punchlines
+        self.loaded_at = loaded_at
+
+    def is_empty(self) -> bool:
+        return not self.swears and not self.punchlines
+
+
+class SwearPackCache:
+    """
+    Swears and punchlines per guild (available as bot.swear_packs), stored in swearer_entries.
+    Guild without own entries of a kind uses default pack (swears file) for that kind.
+    Packs are loaded on first use and kept as tuples - sampling reads them without copying.
+    Editing guild's pack invalidates only that guild, entries older than ttl_seconds are
+    reloaded anyway (changes made directly in database).
+    """
+    def __init__(self, db: Database, ttl_seconds: int = 300):
+        self.db = db
+        self.ttl_seconds = ttl_seconds
+        self.default_pack = SwearPack()
+        self._packs: dict[int, SwearPack] = {} # guild_id -> pack with defaults already filled in
+
+        # Counters
+        self.hits = 0
+        self.loads = 0
+
+    def load_default_file(self, file_path: str):
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.default_pack = SwearPack(tuple(data.get("swears", [])), tuple(data.get("punchlines", [])))
+            self._packs.clear() # guild packs may contain old defaults
+            print(f"#swear_packs.py | OK | Loaded default pack: {len(self.default_pack.swears)} swears and {len(self.default_pack.punchlines)} punchlines")
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            print(f"#swear_packs.py | ERROR! | Cannot load default swear pack: {e}")
+
+    async def get(self, guild_id: Optional[int]) -> SwearPack:
+        if guild_id is None: # DMs
+            return self.default_pack
+        pack = self._packs.get(guild_id)
+        if pack is not None and time.monotonic() - pack.loaded_at < self.ttl_seconds:
+            self.hits += 1
+            return pack
+
+        rows = await self.db.fetchall("SELECT kind, text FROM swearer_entries WHERE guild_id = ? ORDER BY entry_id", (guild_id,))
+        swears = tuple(text for kind, text in rows if kind == KIND_SWEAR)
+        punchlines = tuple(text for kind, text in rows if kind == KIND_PUNCHLINE)
+        pack = SwearPack(
+            swears or self.default_pack.swears,
+            punchlines or self.default_pack.punchlines,
+            time.monotonic()
+        )
+        self._packs[guild_id] = pack
+        self.loads += 1
+        return pack
+
+    def invalidate(self, guild_id: int):
+        self._packs.pop(guild_id, None)
+
+    # --- EDITING (write-through, invalidates only edited guild) ---
+    async def add_entry(self, guild_id: int, kind: str, text: str) -> bool:
+        # False if guild already has this entry
+        changed = await self.db.execute(
+            "INSERT OR IGNORE INTO swearer_entries (guild_id, kind, text) VALUES (?, ?, ?)",
+            (guild_id, kind, text)
+        )
+        self.invalidate(guild_id)
+        return changed > 0
+
+    async def remove_entry(self, guild_id: int, kind: str, text: str) -> bool:
+        # False if guild had no such entry
+        changed = await self.db.execute(
+            "DELETE FROM swearer_entries WHERE guild_id = ? AND kind = ? AND text = ?",
+            (guild_id, kind, text)
+        )
+        self.invalidate(guild_id)
+        return changed > 0
+
+    async def clear(self, guild_id: int) -> int:
+        # Back to default pack, returns number of removed entries
+        changed = await self.db.execute("DELETE FROM swearer_entries WHERE guild_id = ?", (guild_id,))
+        self.invalidate(guild_id)
+        return changed
+
+    async def own_entries(self, guild_id: int, kind: str) -> list[str]:
+        # Only guild's own entries, without defaults
+        rows = await self.db.fetchall(
+            "SELECT text FROM swearer_entries WHERE guild_id = ? AND kind = ? ORDER BY entry_id",
+            (guild_id, kind)
+        )
+        return [row[0] for row in rows]
+
+    def stats(self) -> dict:
+        return {
+            "cached_guilds": len(self._packs),
+            "hits": self.hits,
+            "loads": self.loads,
+        }
@@ -0,0 +1,165 @@
+from typing import Iterable, Optional
+
+from .database import Database
+
+# guild_responses.match_mode values
+MATCH_EXACT = "exact" # whole message equals trigger
+MATCH_WORD = "word" # trigger inside message, on word boundaries
+MATCH_SUBSTRING = "substring" # trigger anywhere inside message
+MATCH_MODES = (MATCH_EXACT, MATCH_WORD, MATCH_SUBSTRING)
+
+RESPONSES_SQL = "SELECT guild_id, trigger_text, response_text, match_mode FROM guild_responses ORDER BY response_id"
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton - finds every occurrence of every pattern in one pass over text,
+    so cost depends on text length (plus number of matches), not on number of patterns.
+    """
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: list[str] = []
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[tuple[int, ...]] = [()]
+
+        for pattern in patterns:
+            self._add(pattern)
+        self._build_links()
+
+    def _add(self, pattern: str):
+        if not pattern:
+            return
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        self._output[state] += (len(self.patterns),)
+        self.patterns.append(pattern)
+
+    def _build_links(self):
+        # Breadth-first, so fail state of parent is always ready before its children
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[next_state] = fail
+                self._output[next_state] += self._output[fail] # outputs of suffixes are merged once, here
+        # Root children fail to root, already set
+
+    def iter_matches(self, text: str):
+        # Yields (end_index, pattern_id), end_index is exclusive
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                for pattern_id in output[state]:
+                    yield index + 1, pattern_id
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+class GuildTriggers:
+    """
+    Triggers of one guild. Exact triggers are dictionary lookup,
+    word/substring triggers share one automaton (built lazily on first use).
+    """
+    def __init__(self, rows: tuple[tuple[str, str, str], ...]):
+        self.rows = rows # (trigger_text, response_text, match_mode), used to detect changes on refresh
+        self.exact: dict[str, str] = {}
+        self._contained: list[tuple[str, str, str]] = [] # (trigger, response, mode) for word/substring
+        self._automaton: Optional[AhoCorasick] = None
+
+        for trigger_text, response_text, match_mode in rows:
+            trigger = trigger_text.lower()
+            if match_mode in (MATCH_WORD, MATCH_SUBSTRING):
+                self._contained.append((trigger, response_text, match_mode))
+            else:
+                self.exact.setdefault(trigger, response_text)
+
+    def match(self, content_lower: str) -> Optional[tuple[str, str]]:
+        """
+        Returns (trigger, response) or None. Exact match wins,
+        otherwise the longest trigger found inside message (older response on tie).
+        """
+        response = self.exact.get(content_lower)
+        if response is not None:
+            return content_lower, response
+        if not self._contained:
+            return None
+
+        if self._automaton is None:
+            self._automaton = AhoCorasick(trigger for trigger, _, _ in self._contained)
+
+        best = None
+        best_id = -1
+        for end, pattern_id in self._automaton.iter_matches(content_lower):
+            trigger, response, mode = self._contained[pattern_id]
+            if best is not None and (len(trigger), -pattern_id) <= (len(best[0]), -best_id):
+                continue
+            if mode == MATCH_WORD:
+                start = end - len(trigger)
+                if start > 0 and _is_word_char(content_lower[start - 1]):
+                    continue
+                if end < len(content_lower) and _is_word_char(content_lower[end]):
+                    continue
+            best = (trigger, response)
+            best_id = pattern_id
+        return best
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+class TriggerIndex:
+    """
+    In-memory auto-responder triggers for all guilds, built from guild_responses.
+    refresh() reloads table and rebuilds only guilds whose responses changed.
+    """
+    def __init__(self, db: Database):
+        self.db = db
+        self._guilds: dict[int, GuildTriggers] = {}
+
+    async def refresh(self) -> int:
+        # Returns number of rebuilt guilds
+        rows = await self.db.fetchall(RESPONSES_SQL)
+        grouped: dict[int, list[tuple[str, str, str]]] = {}
+        for guild_id, trigger_text, response_text, match_mode in rows:
+            grouped.setdefault(guild_id, []).append((trigger_text, response_text, match_mode))
+
+        guilds = {}
+        rebuilt = 0
+        for guild_id, guild_rows in grouped.items():
+            guild_rows = tuple(guild_rows)
+            current = self._guilds.get(guild_id)
+            if current is not None and current.rows == guild_rows:
+                guilds[guild_id] = current # unchanged - keeps already compiled automaton
+            else:
+                guilds[guild_id] = GuildTriggers(guild_rows)
+                rebuilt += 1
+        rebuilt += len(self._guilds.keys() - guilds.keys()) # guilds without any responses now
+        self._guilds = guilds
+        return rebuilt
+
+    def match(self, guild_id: int, content_lower: str) -> Optional[tuple[str, str]]:
+        triggers = self._guilds.get(guild_id)
+        if triggers is None:
+            return None
+        return triggers.match(content_lower)
+
+    def trigger_count(self) -> int:
+        return sum(len(triggers) for triggers in self._guilds.values())
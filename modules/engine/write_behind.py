@@ -0,0 +1,111 @@
+import asyncio
+import time
+from typing import Any, Iterable, Optional
+
+from .database import Database
+
+
+class WriteBehindBuffer:
+    """
+    Write-behind buffer for small, frequent writes (usage rows, warning updates, stat increments).
+    Statements are queued in memory and flushed in one transaction every flush_interval_ms
+    or as soon as max_batch rows are waiting. Consecutive rows with the same SQL are
+    written with single executemany. Order of queued statements is preserved.
+    """
+    def __init__(self, db: Database, flush_interval_ms: int = 500, max_batch: int = 500):
+        self.db = db
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_batch = max_batch
+
+        self._pending: list[tuple[str, tuple]] = []
+        self._batch_full = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Counters
+        self.flushes = 0
+        self.rows_flushed = 0
+        self.rows_failed = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+    def enqueue(self, sql: str, params: Iterable[Any]):
+        self._pending.append((sql, tuple(params)))
+        if len(self._pending) >= self.max_batch:
+            self._batch_full.set()
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._pending)
+
+    def stats(self) -> dict:
+        return {
+            "queue_depth": self.queue_depth,
+            "flushes": self.flushes,
+            "rows_flushed": self.rows_flushed,
+            "rows_failed": self.rows_failed,
+            "last_flush_ms": round(self.last_flush_ms, 2),
+            "avg_flush_ms": round(self._total_flush_ms / self.flushes, 2) if self.flushes else 0.0,
+            "max_flush_ms": round(self.max_flush_ms, 2),
+        }
+
+    # --- LIFECYCLE ---
+    async def start(self):
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop(), name="WriteBehindFlush")
+
+    async def stop(self):
+        # Stops periodic flushing and writes everything what is still queued
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+        print(f"#write_behind.py | OK | Write-behind buffer flushed on shutdown: {self.stats()}")
+
+    async def _flush_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._batch_full.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+    async def flush(self):
+        async with self._flush_lock:
+            self._batch_full.clear()
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, []
+
+            # Grouping consecutive rows with the same statement, so order is kept
+            groups: list[tuple[str, list[tuple]]] = []
+            for sql, params in batch:
+                if groups and groups[-1][0] == sql:
+                    groups[-1][1].append(params)
+                else:
+                    groups.append((sql, [params]))
+
+            async def work(conn):
+                for sql, rows in groups:
+                    cursor = await conn.executemany(sql, rows)
+                    await cursor.close()
+
+            start = time.perf_counter()
+            try:
+                await self.db.transaction(work)
+            except Exception as e:
+                self.rows_failed += len(batch)
+                print(f"#write_behind.py | ERROR | Could not flush {len(batch)} queued writes: {e}")
+                return
+
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.flushes += 1
+            self.rows_flushed += len(batch)
+            self.last_flush_ms = elapsed_ms
+            self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+            self._total_flush_ms += elapsed_ms
@@ -0,0 +1,48 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+
+_ = app_commands.locale_str
+
+class Leaderboard(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.leaderboard = self.bot.leaderboard # Shared top-N structure, created in main
+        self._rendered: dict[tuple[int, str], tuple[int, discord.Embed]] = {} # (guild_id, locale) -> (leaderboard version, embed)
+
+    def _render(self, guild: discord.Guild, locale: discord.Locale) -> discord.Embed:
+        translator = self.bot.translator
+        lines = [
+            translator.get_translation("leaderboard:entry", locale, position=position, user_mention=f"<@{user_id}>", count=count)
+            for position, (user_id, count) in enumerate(self.leaderboard.top(guild.id), start=1)
+        ]
+        return discord.Embed(
+            title=translator.get_translation("leaderboard:embed_title", locale, guild_name=guild.name),
+            description="\n".join(lines),
+            color=discord.Color.gold()
+        )
+
+    @app_commands.command(
+        name=_("leaderboard", key="leaderboard:command_name"),
+        description=_("Shows most active users of this server.", key="leaderboard:command_description")
+    )
+    @app_commands.guild_only()
+    async def leaderboard_command(self, interaction: discord.Interaction):
+        guild = interaction.guild
+        translator = self.bot.translator
+
+        if not self.leaderboard.top(guild.id):
+            await interaction.response.send_message(translator.get_translation("leaderboard:empty", interaction.locale), ephemeral=True)
+            return
+
+        # Rendered embed is reused until leaderboard of this guild changes
+        cache_key = (guild.id, str(interaction.locale))
+        version = self.leaderboard.version(guild.id)
+        cached = self._rendered.get(cache_key)
+        if cached is None or cached[0] != version:
+            cached = self._rendered[cache_key] = (version, self._render(guild, interaction.locale))
+
+        await interaction.response.send_message(embed=cached[1], allowed_mentions=discord.AllowedMentions.none())
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Leaderboard(bot))
@@ -1,86 +1,199 @@
+import asyncio
+import time
 import discord
-from discord.ext import commands
-import aiosqlite
+from discord.ext import commands, tasks
+from functools import partial
+
+from ..engine.fair_scheduler import PRIORITY_HIGH
+from ..engine.rename_debouncer import ChannelRenameDebouncer
 
 
 class RoleCounter(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.db_path = self.bot.config["database_path"]  # Assuming database path is set in config
+        self.guild_config = self.bot.guild_config  # Cached guild configuration, shared from main
+
+        # Channel renames are heavily rate limited - only latest count is applied, at most renames_per_window per channel
+        settings = self.bot.config.get("role_counter", {})
+        self.renamer = ChannelRenameDebouncer(
+            self.bot,
+            renames_per_window=settings.get("renames_per_window", 2),
+            window_seconds=settings.get("rename_window_seconds", 600),
+            delay_seconds=settings.get("rename_delay_seconds", 5)
+        )
+
+        # Member counts of counted roles, kept by deltas from member events instead of len(role.members) scans.
+        # Roles are counted from cache on ready and when counter is added, then only changed by +1/-1.
+        # Periodic reconcile fixes drift (event already in cache when role was counted gets its delta twice)
+        self._counts: dict[int, dict[int, int]] = {} # guild_id -> role_id -> members with role
+        self.startup_concurrency = settings.get("startup_concurrency", 4) # guilds refreshed at once after startup
+        self.reconcile_minutes = settings.get("reconcile_minutes", 30)
+
+    async def cog_load(self):
+        if self.reconcile_minutes > 0:
+            self.reconcile_counts.change_interval(minutes=self.reconcile_minutes)
+            self.reconcile_counts.start()
+
+    def cog_unload(self):
+        self.reconcile_counts.cancel()
+        self.renamer.stop()
+
+    # --- COUNTS ---
+    def seed(self, role: discord.Role) -> int:
+        # Full recount from member cache, must happen before deltas for this role are applied
+        count = self._counts.setdefault(role.guild.id, {})[role.id] = len(role.members)
+        return count
+
+    def _seed_all(self):
+        self._counts.clear()
+        for guild_id, role_id in self.guild_config.role_counters():
+            guild = self.bot.get_guild(guild_id)
+            role = guild.get_role(role_id) if guild else None
+            if role is not None:
+                self.seed(role)
+
+    def role_count(self, role: discord.Role) -> int:
+        count = self._counts.get(role.guild.id, {}).get(role.id)
+        if count is None:
+            count = self.seed(role) # counter added outside of bot (picked up by config refresh)
+        return count
+
+    def _apply_delta(self, guild_id: int, roles, delta: int) -> list[int]:
+        # Changes tracked counts, returns ids of counted roles (their channels need update)
+        counted_roles = self.guild_config.counted_roles(guild_id)
+        tracked = self._counts.get(guild_id)
+        if not counted_roles and not tracked: # guild without counters - one lookup per event
+            return []
+        counted = []
+        for role in roles:
+            if tracked and role.id in tracked: # untracked role is counted from cache on first use, change is already there
+                tracked[role.id] += delta
+            if role.id in counted_roles:
+                counted.append(role.id)
+        return counted
+
+    def _schedule_updates(self, guild_id: int, role_ids: list[int]):
+        # Through per-guild queue - mass role changes in one guild don't delay other guilds
+        for role_id in role_ids:
+            self.bot.scheduler.submit(guild_id, partial(self.update_counter, guild_id, role_id), PRIORITY_HIGH)
 
     async def update_counter(self, guild_id: int, role_id: int):
+        # Most role changes are for roles without counter - answered from cache
+        channel_id = self.guild_config.get_counter_channel_id(guild_id, role_id)
+        if channel_id is None:
+            self._counts.get(guild_id, {}).pop(role_id, None)
+            return
+
         guild = self.bot.get_guild(guild_id)
-        role = guild.get_role(role_id)
+        role = guild.get_role(role_id) if guild else None
         if not guild or not role:
             #deleting from database server/role that has been already deleted
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("DELETE FROM role_counters WHERE guild_id = ? and role_id = ?",(guild_id, role_id))
-                await db.commit()
+            await self.guild_config.remove_role_counter(guild_id, role_id)
+            self.renamer.cancel(channel_id)
             return
-    
-        async with aiosqlite.connect(self.db_path) as db: 
-          async with db.execute("SELECT channel_id FROM role_counters WHERE guild_id = ? AND role_id = ?",(guild_id, role_id)) as cursor:
-            result = await cursor.fetchone()
-            if not result:
-                return
-            channel_id = result[0]
 
         channel = guild.get_channel(channel_id)
         if not channel:
             #deleting from database channel that has been already deleted
-            async with aiosqlite.connect(self.db_path) as db:
-               await db.execute("DELETE FROM role_counters WHERE role_id = ?", (role_id,))
-               await db.commit()
+            await self.guild_config.remove_role_counter(guild_id, role_id)
+            self.renamer.cancel(channel_id)
             return
         
-        count = len(role.members)
+        count = self.role_count(role)
         new_name = f"{role.name}: {count}"
 
-        try:
-            if channel.name != new_name:
-                await channel.edit(name=new_name, reason="Automatic update of role counter")
-        except discord.errors.Forbidden:
-            print(f"#role_counter.py | Error! | No privileges to edit channel {channel.name} on server {guild.name}")
-        except Exception as e:
-            print(f"Unexpected error during refreshing channel: {e}")
+        # Always requested - replaces older waiting name even when channel already shows this one
+        self.renamer.request(channel.id, new_name, reason="Automatic update of role counter")
 
 
     @commands.Cog.listener()
     async def on_ready(self):
         print("#role_counter.py | Ready, starting update of role counters in background...")
+        self._seed_all() # member cache was (re)built, so counts are taken from it again before any deltas
         self.bot.loop.create_task(self.update_all_counters(), name="UpdateAllRoleCounters")
     
     async def update_all_counters(self):
     ###updating counters after bot startup###
         await self.bot.wait_until_ready()
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                async with db.execute("SELECT guild_id, role_id FROM role_counters") as cursor:
-                    all_counters = await cursor.fetchall()
-
-                    if not all_counters:
-                        print("#role_counter.py | WARNING | No role counters found in the database to update")
-                        return
-                    print(f"#role_counter.py | Found {len(all_counters)} role counters to update")
-                    
-                    for guild_id, role_id in all_counters:
-                        await self.update_counter(guild_id,role_id)
-
-            print("#role_counter.py | Task 'UpdateAllRoleCounters' finished succesfully.")
+            all_counters = self.guild_config.role_counters()
+
+            if not all_counters:
+                print("#role_counter.py | WARNING | No role counters found in the database to update")
+                return
+            print(f"#role_counter.py | Found {len(all_counters)} role counters to update")
+
+            by_guild: dict[int, list[int]] = {}
+            for guild_id, role_id in all_counters:
+                by_guild.setdefault(guild_id, []).append(role_id)
+
+            # Guilds are refreshed concurrently, semaphore keeps number of guilds counted at once bounded
+            semaphore = asyncio.Semaphore(self.startup_concurrency)
+            start = time.perf_counter()
+            await asyncio.gather(*(self._refresh_guild(semaphore, guild_id, role_ids) for guild_id, role_ids in by_guild.items()))
+
+            print(f"#role_counter.py | Task 'UpdateAllRoleCounters' finished succesfully ({len(by_guild)} guilds in {(time.perf_counter() - start) * 1000:.1f} ms).")
         except Exception as e:
             print(f"#role_counter.py | WARNING! |An error occured in the 'UpdateAllCounters' task: {e}")
    
+    async def _refresh_guild(self, semaphore: asyncio.Semaphore, guild_id: int, role_ids: list[int]):
+        async with semaphore:
+            start = time.perf_counter()
+            for role_id in role_ids:
+                try:
+                    await self.update_counter(guild_id, role_id)
+                except Exception as e:
+                    print(f"#role_counter.py | WARNING! | Could not update counter of role {role_id} on server {guild_id}: {e}")
+            print(f"#role_counter.py | Info | Updated {len(role_ids)} counters of server {guild_id} in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    @tasks.loop(minutes=30) # This value is default, will be overwritten in cog_load
+    async def reconcile_counts(self):
+        # Resync of tracked counts with member cache, also picks up counters added outside of bot
+        fixed = []
+        for guild_id, role_id in self.guild_config.role_counters():
+            guild = self.bot.get_guild(guild_id)
+            role = guild.get_role(role_id) if guild else None
+            if role is None:
+                continue
+            tracked = self._counts.get(guild_id, {}).get(role_id)
+            actual = len(role.members)
+            if tracked != actual:
+                self.seed(role)
+                fixed.append((guild_id, role_id))
+                if tracked is not None:
+                    print(f"#role_counter.py | WARNING | Count of role {role_id} on server {guild_id} drifted ({tracked} -> {actual}), fixed")
+        for guild_id, role_id in fixed:
+            self._schedule_updates(guild_id, [role_id])
+
+    @reconcile_counts.before_loop
+    async def before_reconcile_counts(self):
+        await self.bot.wait_until_ready()
+
     @commands.Cog.listener()
     async def on_member_update(self, before: discord.Member, after: discord.Member):
         ###check outs role change for user
         if before.roles == after.roles:
             return
 
-        changed_roles = set(before.roles) ^ set(after.roles)
         guild_id = after.guild.id
+        if not self.guild_config.counted_roles(guild_id) and not self._counts.get(guild_id):
+            return # guild without counters, no role sets built
+
+        before_roles = set(before.roles)
+        after_roles = set(after.roles)
+
+        # Deltas applied right in listener, so they follow event order
+        counted = self._apply_delta(guild_id, after_roles - before_roles, 1)
+        counted += self._apply_delta(guild_id, before_roles - after_roles, -1)
+        self._schedule_updates(guild_id, counted)
 
-        for role in changed_roles:
-            await self.update_counter(guild_id, role.id)
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self._schedule_updates(member.guild.id, self._apply_delta(member.guild.id, member.roles, 1))
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self._schedule_updates(member.guild.id, self._apply_delta(member.guild.id, member.roles, -1))
    
    
 async def setup(bot: commands.Bot):
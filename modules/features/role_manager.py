@@ -2,19 +2,22 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from discord.ui import Select, View
-import aiosqlite
 
 # --- UI components ---
 
+MAX_OPTIONS = 25 # Discord limit for select menu
+
+
 class RoleSelectMenu(Select):
-    def __init__(self, bot, user_roles, selectable_roles_data):
+    def __init__(self, bot, member: discord.Member, selectable_roles_data):
         self.bot = bot
+        guild = member.guild
         options = []
-        for role_id, role_description in selectable_roles_data:
-            role = bot.get_guild(user_roles[0].guild.id).get_role(role_id)
+        for role_id, role_description in selectable_roles_data[:MAX_OPTIONS]:
+            role = guild.get_role(role_id)
             if role:
                 #Checking if user already has a role
-                is_selected = role in user_roles
+                is_selected = member.get_role(role_id) is not None
                 options.append(discord.SelectOption(
                     label=role.name,
                     value=str(role.id),
@@ -31,34 +34,31 @@ class RoleSelectMenu(Select):
     async def callback(self, interaction: discord.Interaction):
         member = interaction.user
         selected_role_ids = {int(value) for value in self.values}
-
         all_selectable_roles_in_menu = {int(opt.value) for opt in self.options}
 
-        roles_to_add = {role_id for role_id in selected_role_ids if member.get_role(role_id) is None}
-        roles_to_remove = {role_id for role_id in all_selectable_roles_in_menu if role_id not in selected_role_ids and member.get_role(role_id) is not None}
-
-        guild = member.guild
-        final_add = [guild.get_role(role_id) for role_id in roles_to_add]
-        final_remove = [guild.get_role(role_id) for role_id in roles_to_remove]
+        # Roles outside of menu stay as they are, menu roles are exactly the selected ones
+        current_role_ids = {role.id for role in member.roles[1:]} # without @everyone
+        new_role_ids = (current_role_ids - all_selectable_roles_in_menu) | selected_role_ids
 
         try:
-            if final_add: await member.add_roles(*final_add, reason="Role self-management")
-            if final_remove: await member.remove_roles(*final_remove, reason="Role self-management")
+            if new_role_ids != current_role_ids:
+                # One request for all changes, instead of separate add_roles and remove_roles
+                await member.edit(roles=[discord.Object(id=role_id) for role_id in new_role_ids], reason="Role self-management")
             await interaction.response.send_message("You roles has been changed!", ephemeral=True) #TODO language pack
         except discord.Forbidden:
             await interaction.response.send_message("Error: I do not have privileges to change Your roles.", ephemeral=True)
 
 class RolePanelView(View):
-    def __init__(self, bot, user_roles, selectable_roles_data):
+    def __init__(self, bot, member: discord.Member, selectable_roles_data):
         super().__init__(timeout=300)
-        self.add_item(RoleSelectMenu(bot, user_roles, selectable_roles_data))
+        self.add_item(RoleSelectMenu(bot, member, selectable_roles_data))
 
 # --- Main Cog ---
 
 class RoleManager(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.db_path = self.bot.config["database_path"]
+        self.selectable_roles = self.bot.selectable_roles # Cached required role -> selectable roles map, shared from main
 
     @app_commands.command(name="role", description="Opens panel for role self-management") #TODO language pack
     async def roles(self,interaction: discord.Interaction):
@@ -76,30 +76,10 @@ class RoleManager(commands.Cog):
                 await interaction.followup.send("Couldn't download your data from this server.", ephemeral=True) #TODO language pack
                 return
             
-        member_role_ids = {role.id for role in member.roles}
-
-        all_selectable_roles = [] 
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row # allows access to colums per name
-                # Crucial SQL Logic
-
-                placeholders = ', '.join('?' for _ in member_role_ids) # Creating placeholders for each user role
-
-                params = [interaction.guild.id] + list(member_role_ids) #Preparing values to add into query, first is quild_id other is roles IDs
-
-                query = f"""
-                    SELECT sr.role_id, sr.role_description
-                    FROM selectable_roles sr
-                    JOIN role_group_permissions rgp ON sr.group_id = rgp.group_id
-                    WHERE sr.guild_id = ? AND rgp.required_role_id IN ({placeholders})
-                """
-
-                cursor = await db.execute(query, params)
-                all_selectable_roles = await cursor.fetchall()
-
-                unique_roles = {row['role_id']: row for row in all_selectable_roles} #Removing duplicates if user has acces to role from different groups(ex. VIP and moderator has same roles in groups)
-                all_selectable_roles = list(unique_roles.values())
+            # Union of roles available through member's roles, answered from cache
+            all_selectable_roles = await self.selectable_roles.roles_for(interaction.guild.id, (role.id for role in member.roles))
+            all_selectable_roles = [row for row in all_selectable_roles if interaction.guild.get_role(row[0])] # skipping deleted roles
         except Exception as e:
             print(f"#role_manager.py| ERROR! | Exception during downloading roles to be chosen from database: {e}")
             await interaction.followup.send("There occured error during downloading available roles", ephemeral=True)
@@ -108,7 +88,7 @@ class RoleManager(commands.Cog):
             await interaction.followup.send("You dont have acces to any roles to be chosen or no roles has been configured on this server", ephemeral=True)
             return
         
-        view = RolePanelView(self.bot, member.roles, all_selectable_roles)
+        view = RolePanelView(self.bot, member, all_selectable_roles)
         await interaction.followup.send("Select roles from below list:", view=view, ephemeral=True)
 
 async def setup(bot: commands.Bot):
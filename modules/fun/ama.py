@@ -5,6 +5,10 @@ import json
 import random
 import os
 
+from ..engine.message_router import RoutedMessage
+
+MATCHER_NAME = "ama"
+
 class QuestionResponder(commands.Cog):
     def __init__(self,bot: commands.Bot):
         self.bot = bot
@@ -30,29 +34,29 @@ class QuestionResponder(commands.Cog):
             print(f"#ama.py | ERROR! | Could not load ama response file: {e}")
 
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        if message.author.bot:
-            return # Ignore bot messages
-        
-        ## We are checking two statements:
+    async def cog_load(self):
+        self.bot.message_router.register(MATCHER_NAME, self.wants_message, self.handle_message)
+
+    async def cog_unload(self):
+        self.bot.message_router.unregister(MATCHER_NAME)
+
+    def wants_message(self, routed: RoutedMessage) -> bool:
+        ## We are checking two statements (both computed once by router):
         ## 1. If bot has been mentioned in message?
         ## 2. Does message ends with an question mark?(after removing white types from end)
+        return routed.is_bot_mentioned and routed.is_question
 
-        mentioned_ids = [user.id for user in message.mentions]
-        is_bot_mentioned = self.bot.user.id in mentioned_ids
-        is_a_question = message.content.strip().endswith('?')
-    
+    async def handle_message(self, routed: RoutedMessage):
+        message = routed.message
         translator = self.bot.translator
-        if is_bot_mentioned and is_a_question:
-            if not self.all_answers: # Check if we have any response to randomize
-                error_msg = translator.get_translation("orphans:ama_no_response", message.author.locale)
-                await message.reply(error_msg)
-                return
-            
-            response = random.choice(self.all_answers) # Select random response
-
-            await message.reply(response) #Sends an response, better than "channel send" as it has bond with message
+        if not self.all_answers: # Check if we have any response to randomize
+            error_msg = translator.get_translation("orphans:ama_no_response", message.author.locale)
+            await message.reply(error_msg)
+            return
+
+        response = random.choice(self.all_answers) # Select random response
+
+        await message.reply(response) #Sends an response, better than "channel send" as it has bond with message
 
 
 async def setup(bot: commands.Bot): #standard setup function
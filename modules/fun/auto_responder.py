@@ -1,132 +1,152 @@
+import asyncio
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord import app_commands
 import json
 import os
-import aiosqlite
 import random
-from ..engine.cooldown_manager import CooldownManager
+from collections import OrderedDict
+from typing import Optional
+
+from ..engine.message_router import RoutedMessage
+from ..engine.trigger_index import TriggerIndex
 
 MODULE_NAME = "auto_responder"
+MAX_TRACKED_CHANNELS_PER_GUILD = 50 # last responses remembered per guild, least recently used are dropped
 
 _ = app_commands.locale_str
 
 class AutoResponder(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        db_path = self.bot.config["database_path"] 
         
-        self.cooldown_manager = CooldownManager(db_path)
-        self.last_response_map = {} #to track last response of bot
-   
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        # Ignoring messages that we don't want to process ---
-        if message.author.bot or not message.guild:
-            return
+        self.cooldown_manager = self.bot.cooldown_manager # Shared between modules, created in main
+        self.last_response_map: dict[int, OrderedDict[int, int]] = {} # guild_id -> {channel_id: last bot response id}, to track last response of bot
+        self.trigger_index = TriggerIndex(self.bot.db) # All guild triggers in memory, no query per message
+
+    async def cog_load(self):
+        await self.trigger_index.refresh()
+        print(f"#auto_responder.py | OK | Loaded {self.trigger_index.trigger_count()} response triggers")
+        refresh_seconds = self.bot.config.get("database", {}).get("config_refresh_interval_seconds", 300)
+        if refresh_seconds > 0:
+            self.refresh_triggers.change_interval(seconds=refresh_seconds)
+            self.refresh_triggers.start()
+        self.bot.message_router.register(MODULE_NAME, self.wants_message, self.handle_message)
 
-        #  Loading messages and changing content to small letters
-        message_content_lower = message.content.lower()
-        guild_id = message.guild.id
-        db_path = self.bot.config["database_path"]
+    async def cog_unload(self):
+        self.bot.message_router.unregister(MODULE_NAME)
+        self.refresh_triggers.cancel()
 
-        response_text = None
-        module_enabled = False
+    @tasks.loop(seconds=300) # This value is default, will be overwritten in cog_load
+    async def refresh_triggers(self):
+        # Picks up responses changed outside of bot, only changed guilds are rebuilt
         try:
-            async with aiosqlite.connect(db_path) as db:
-                db.row_factory = aiosqlite.Row
-                
-                # Checking if module is enabled in guild
-                cursor = await db.execute(
-                    "SELECT 1 FROM guild_modules WHERE guild_id = ? AND module_name = ? AND is_enabled = 1",
-                    (guild_id, MODULE_NAME)
-                )
-                if await cursor.fetchone():
-                    module_enabled = True
-
-                # Getting response from database
-                if module_enabled:
-                    cursor = await db.execute(
-                        "SELECT response_text FROM guild_responses WHERE guild_id = ? AND trigger_text = ?",
-                        (guild_id, message_content_lower)
-                    )
-                    result = await cursor.fetchone()
-                    if result:
-                        response_text = result[0]        
+            rebuilt = await self.trigger_index.refresh()
+            if rebuilt:
+                print(f"#auto_responder.py | Info | Rebuilt response triggers for {rebuilt} guilds")
         except Exception as e:
-            print(f"#auto_responder.py | ERROR! | Error while connecting to database: {e}") #TODO language pack
-        
+            print(f"#auto_responder.py | ERROR | Could not refresh response triggers: {e}")
+
+    def wants_message(self, routed: RoutedMessage) -> bool:
+        # Only guild messages, module enabled in guild (cached, no database access)
+        return routed.guild_id is not None and self.bot.guild_config.is_module_enabled(routed.guild_id, MODULE_NAME)
+
+    async def handle_message(self, routed: RoutedMessage):
+        message = routed.message
+        guild_id = routed.guild_id
+
+        # Exact trigger or word/substring triggers found in one pass over message
+        match = self.trigger_index.match(guild_id, routed.content_lower)
+
         # Found response, proceeding to check cooldown and if not - send message
-        if response_text:
-            
-            feature_name = f"{message_content_lower}_response"
+        if match:
+            trigger, response_text = match
+            feature_name = f"{trigger}_response"
             user_id = message.author.id
-            can_use, reason = await self.cooldown_manager.check_cooldown(user_id, guild_id, feature_name)
+            # Checks limits, records usage and resets warnings in one atomic step
+            can_use, reason = await self.cooldown_manager.try_acquire(user_id, guild_id, feature_name)
             
             # A) user can use feature            
             if can_use:
-                await self.cooldown_manager.record_usage(user_id, guild_id, feature_name)
-                await self.cooldown_manager.reset_warnings(user_id, guild_id, feature_name)
-
                 sent_message = await message.channel.send(response_text)
-                self.last_response_map[message.channel.id] = sent_message.id
+                self._remember_response(guild_id, message.channel.id, sent_message.id)
                 return
             # B) User is on cooldown - cannot use
             else:
-                # 1. Attempt to delete user message if it is on cooldown
-                try:
-                    translator = self.bot.translator
-                    await message.delete()  
-                # 2. Delete last bot mesage if exists
-                    if message.channel.id in self.last_response_map:
-                        try:
-                            last_bot_message = await message.channel.fetch_message(self.last_response_map[message.channel.id])
-                            await last_bot_message.delete() # Attempt to delete last bot response
-                        except (discord.NotFound, discord.Forbidden):
-                            pass
-                        finally:
-                            self.last_response_map.pop(message.channel.id, None) # if message is already deleted or we not have privileges
-
-                # 3. Raise warning level, check what to do next
-                    warning_level = await self.cooldown_manager.issue_warning(user_id, guild_id, feature_name)
-                    dm_threshold = 999
-
-                    async with aiosqlite.connect(db_path) as db:
-                            db.row_factory = aiosqlite.Row
-                            cursor = await db.execute(
-                                "SELECT dm_warning_threshold FROM guild_cooldowns WHERE guild_id = ? AND feature_name = ?",
-                                (guild_id, feature_name)
-                            )
-                            result = await cursor.fetchone()
-                            if result and result["dm_warning_threshold"] is not None:
-                                dm_threshold = result["dm_warning_threshold"]
-                
-                # 4. If warning threshold is reached, send DM.
-                    if warning_level >= dm_threshold: 
-                        try:
-                            dm_text_variants = translator.get_translation("orphans:cooldown_dm_warning", message.author.locale)
-                            if isinstance(dm_text_variants, list) and dm_text_variants:
-                                dm_text = random.choice(dm_text_variants)
-                                await message.author.send(dm_text)
-                                await self.cooldown_manager.reset_warnings(user_id, guild_id, feature_name) # reseting counter after sending DM
-                            else:
-                                print("#auto_responder.py | ERROR | Key 'cooldown_dm_warning' is not an list or is empty")
-                        except discord.Forbidden:
-                            print(f"#auto_responder.py | Info | Cannot send DM to {message.author}, blocked DMs.")
-                #4a. if there is no way to sent DM - there will be sent message on channel
-                    else:
-                        channel_warning_text = translator.get_translation(
-                            "orphans:cooldown_channel_warning",
-                            message.author.locale,
-                            user_mention=message.author.mention
-                        )
-                        await message.channel.send(channel_warning_text, delete_after=10)
-                except discord.Forbidden:
-                    print(f"#auto_responder.py | Info | Cannot delete message from {message.author} in {message.guild.name}: No privilleges.")
-                except Exception as e:
-                    print(f"#auto_responder.py | WARNING | Error in else block: {type(e).__name__}: {e}")
+                # Side effects don't depend on each other - REST calls go out concurrently
+                results = await asyncio.gather(
+                    self._delete_user_message(message),
+                    self._delete_last_response(message.channel, guild_id),
+                    self._warn_user(message, guild_id, feature_name),
+                    return_exceptions=True
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        print(f"#auto_responder.py | WARNING | Error while handling cooldown: {type(result).__name__}: {result}")
                 return
 
-        await self.bot.process_commands(message)
+    # --- LAST RESPONSES (bounded LRU per guild) ---
+    def _remember_response(self, guild_id: int, channel_id: int, message_id: int):
+        channels = self.last_response_map.setdefault(guild_id, OrderedDict())
+        channels[channel_id] = message_id
+        channels.move_to_end(channel_id)
+        if len(channels) > MAX_TRACKED_CHANNELS_PER_GUILD:
+            channels.popitem(last=False) # least recently answered channel
+
+    def _forget_response(self, guild_id: int, channel_id: int) -> Optional[int]:
+        channels = self.last_response_map.get(guild_id)
+        if not channels:
+            return None
+        return channels.pop(channel_id, None)
+
+    # --- COOLDOWN VIOLATION STEPS ---
+    async def _delete_user_message(self, message: discord.Message):
+        # 1. Attempt to delete user message if it is on cooldown
+        try:
+            await message.delete()
+        except discord.NotFound:
+            pass
+        except discord.Forbidden:
+            print(f"#auto_responder.py | Info | Cannot delete message from {message.author} in {message.guild.name}: No privilleges.")
+
+    async def _delete_last_response(self, channel: discord.abc.Messageable, guild_id: int):
+        # 2. Delete last bot mesage if exists - partial message from stored id, no fetch needed
+        message_id = self._forget_response(guild_id, channel.id)
+        if message_id is None:
+            return
+        try:
+            await channel.get_partial_message(message_id).delete()
+        except (discord.NotFound, discord.Forbidden):
+            pass # if message is already deleted or we not have privileges
+
+    async def _warn_user(self, message: discord.Message, guild_id: int, feature_name: str):
+        # 3. Raise warning level, check what to do next (threshold from cached rules)
+        translator = self.bot.translator
+        user_id = message.author.id
+        warning_level = await self.cooldown_manager.issue_warning(user_id, guild_id, feature_name)
+        threshold = self.bot.guild_config.get_dm_warning_threshold(guild_id, feature_name)
+        dm_threshold = 999 if threshold is None else threshold # 0 is valid - DM on every violation
+
+        # 4. If warning threshold is reached, send DM.
+        if warning_level >= dm_threshold:
+            try:
+                dm_text_variants = translator.get_translation("orphans:cooldown_dm_warning", message.author.locale)
+                if isinstance(dm_text_variants, list) and dm_text_variants:
+                    dm_text = random.choice(dm_text_variants)
+                    await message.author.send(dm_text)
+                    await self.cooldown_manager.reset_warnings(user_id, guild_id, feature_name) # reseting counter after sending DM
+                else:
+                    print("#auto_responder.py | ERROR | Key 'cooldown_dm_warning' is not an list or is empty")
+            except discord.Forbidden:
+                print(f"#auto_responder.py | Info | Cannot send DM to {message.author}, blocked DMs.")
+        #4a. if there is no way to sent DM - there will be sent message on channel
+        else:
+            channel_warning_text = translator.get_translation(
+                "orphans:cooldown_channel_warning",
+                message.author.locale,
+                user_mention=message.author.mention
+            )
+            await message.channel.send(channel_warning_text, delete_after=10)
+
 async def setup(bot: commands.Bot):
     await bot.add_cog(AutoResponder(bot))
\ No newline at end of file
@@ -2,7 +2,6 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import random
-import aiosqlite
 from typing import List, Optional
 
 from ..engine.guild_utils import get_accessible_guilds_for_feature
@@ -13,7 +12,6 @@ class Jokes(commands.Cog):
     #adding for module an name and description
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.db_path = self.bot.config["database_path"]
 
     # --- Helper functions and for autocompletion
     async def get_categories_for_context(self, interaction: discord.Interaction) -> List[str]:
@@ -30,15 +28,11 @@ class Jokes(commands.Cog):
         guild_ids = [g.id for g in guilds_to_check]
         placeholders = ', '.join('?' for _ in guild_ids)
 
-        categories = []
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(
-                f"SELECT DISTINCT category FROM jokes WHERE guild_id IN ({placeholders})",
-                guild_ids
-            )
-            rows = await cursor.fetchall()
-            categories = [row[0] for row in rows]
-        return categories
+        rows = await self.bot.db.fetchall(
+            f"SELECT DISTINCT category FROM jokes WHERE guild_id IN ({placeholders})",
+            guild_ids
+        )
+        return [row[0] for row in rows]
     
     async def category_autocomplete(self, interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
         """Dynamic autocompletion of jokes category"""
@@ -79,14 +73,12 @@ class Jokes(commands.Cog):
         placeholders = ', '.join('?' for _ in guild_ids)
 
         joke_text = None
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(
-                f"SELECT text FROM jokes WHERE guild_id IN ({placeholders}) ORDER BY RANDOM() LIMIT 1",
-                guild_ids
-            )
-            result = await cursor.fetchone()
-            if result:
-                joke_text = result[0]
+        result = await self.bot.db.fetchone(
+            f"SELECT text FROM jokes WHERE guild_id IN ({placeholders}) ORDER BY RANDOM() LIMIT 1",
+            guild_ids
+        )
+        if result:
+            joke_text = result[0]
 
         if joke_text:
             await interaction.followup.send(joke_text)
@@ -125,14 +117,12 @@ class Jokes(commands.Cog):
         params = guild_ids + [category]
 
         joke_text = None
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute (
-                f"SELECT text FROM jokes WHERE guild_id IN ({placeholders}) AND category = ? ORDER BY RANDOM() LIMIT 1",
-                params
-            )
-            result = await cursor.fetchone()
-            if result:
-                joke_text = result[0]
+        result = await self.bot.db.fetchone(
+            f"SELECT text FROM jokes WHERE guild_id IN ({placeholders}) AND category = ? ORDER BY RANDOM() LIMIT 1",
+            params
+        )
+        if result:
+            joke_text = result[0]
 
         if joke_text:
             await interaction.followup.send(joke_text)
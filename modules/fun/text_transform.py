@@ -0,0 +1,146 @@
+import random
+from typing import Optional, Sequence
+
+# ==============================================================================
+# SHARED TEXT TRANSFORMS (sra, swearer)
+# Text is tokenized once - words and their lowercase forms share word offsets (list index),
+# so scoring and insertion are single linear passes without searching for words again.
+# Every transform takes optional random.Random - seeded instance gives reproducible results.
+# ==============================================================================
+
+
+class Tokens:
+    __slots__ = ("words", "lower")
+
+    def __init__(self, text: str):
+        self.words = text.split()
+        self.lower = text.lower().split() # lowercased in one pass, same offsets as words
+        if len(self.lower) != len(self.words): # lowercasing never adds whitespace, but being safe costs nothing
+            self.lower = [word.lower() for word in self.words]
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def join(self) -> str:
+        return " ".join(self.words)
+
+
+def interleave(words: Sequence[str], extras: Sequence[str], rng: Optional[random.Random] = None) -> list[str]:
+    """
+    Puts every extra into uniformly random gap between words (or at either end), words keep their order.
+    Replaces repeated list.insert (O(n*k)) with one O(n + k log k) pass.
+    """
+    rng = rng or random
+    gap_count = len(words) + 1
+    gaps = sorted(int(rng.random() * gap_count) for _ in extras)
+
+    result = []
+    word_offset = 0
+    for extra, gap in zip(extras, gaps):
+        result.extend(words[word_offset:gap])
+        word_offset = gap
+        result.append(extra)
+    result.extend(words[word_offset:])
+    return result
+
+
+def sample_distinct(population: Sequence[str], k: int, rng: Optional[random.Random] = None) -> list[str]:
+    """
+    k distinct elements of population in random order, population is only indexed.
+    Packs are much bigger than number of swears per message, so picking indices with rejection
+    costs O(k) - random.sample copies whole population into a list for k that is large compared to it.
+    When more than half of population is taken, that copy is O(k) anyway, so random.sample is used.
+    """
+    rng = rng or random
+    n = len(population)
+    if k * 2 > n:
+        return rng.sample(population, k)
+    rand = rng.random
+    chosen = set()
+    result = []
+    for _ in range(k):
+        index = int(rand() * n)
+        while index in chosen: # at most half taken, so on average less than 2 tries
+            index = int(rand() * n)
+        chosen.add(index)
+        result.append(population[index])
+    return result
+
+
+# --- SRA ---
+def sra_transform(text: str, rng: Optional[random.Random] = None) -> tuple[Optional[str], Optional[str]]:
+    """
+    Replaces best scored word with 'sra' + its suffix after one of its 'a' letters.
+    Returns (result_text, error_key) - one of them is None.
+    """
+    rng = rng or random
+    if not text or not text.strip():
+        return None, "sra:error_no_text_provided"
+
+    tokens = Tokens(text)
+    words = tokens.words
+
+    # Step 1 - filtering candidates (offsets of words), lowercase forms are already there
+    lowers = tokens.lower
+    candidates = [
+        offset for offset, lower in enumerate(lowers)
+        if 'a' in lower and len(lower) > 2 and not lower.endswith("sra") and len(words[offset]) > 2
+    ]
+    if not candidates:
+        return None, "sra:error_no_words_found"
+
+    # Step 2 - scoring candidates, 'a' counted once per word
+    best_offset = None
+    highest_score = -1
+    for offset in candidates:
+        lower = lowers[offset]
+        a_count = lower.count('a')
+        score = 3 * a_count # Each 'a' in word gives 3 points
+        if len(words[offset]) > 4: # Longer words get more points
+            score += 2
+        if a_count == 1 and lower[-1] == 'a': # If word ends with 'a' and has only one 'a', it gets -4 points
+            score -= 4
+        if score > highest_score: # first word wins on tie
+            highest_score = score
+            best_offset = offset
+
+    if best_offset is None:
+        best_offset = rng.choice(candidates) # Fallback to random word if no best found
+
+    # Step 3 - choosing 'a', earlier ones have bigger chance (weights n, n-1, ..., 1)
+    best_word = words[best_offset]
+    a_indices = [i for i, char in enumerate(best_word) if char == 'a' or char == 'A']
+    chosen_a_index = rng.choices(a_indices, weights=range(len(a_indices), 0, -1), k=1)[0]
+
+    prefix = "Sra" if best_word[0].isupper() else "sra"
+    words[best_offset] = prefix + best_word[chosen_a_index + 1:]
+
+    # Step 4 - returning edited text
+    return tokens.join(), None
+
+
+# --- SWEARER ---
+def swear_transform(
+    text: str,
+    swears: Sequence[str],
+    punchlines: Sequence[str],
+    rng: Optional[random.Random] = None
+) -> str:
+    """
+    Inserts random swears between words (up to half of word count) and appends random punchline.
+    """
+    rng = rng or random
+    words = text.split()
+    num_words = len(words)
+    if num_words == 0:
+        return ""
+
+    max_curses = num_words // 2
+    min_curses = max(0, num_words // 5 - 1)
+    num_curses = min(rng.randint(min_curses, max_curses), len(swears)) # Not exceeding number of available swears
+
+    if num_curses > 0:
+        words = interleave(words, sample_distinct(swears, num_curses, rng), rng)
+
+    punchline = rng.choice(punchlines) if punchlines else ""
+    return (" ".join(words) + " " + punchline).strip()